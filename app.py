@@ -1,84 +1,240 @@
+import multiprocessing
+
+# In the frozen Windows build every PDF worker process starts by running this script again;
+# hand those processes over to multiprocessing before the imports and definitions below
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+
 import eel
 import os
+import atexit
 import pickle
+import io
+import base64
 import zipfile
-import tempfile
 import csv
-import traceback
-from seances import Seances, Seance
-from enseignants import Enseignants
+import time
+import threading
+import logging
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from seances import Seances, Seance, seance_name, parse_date, iter_xlsx_rows, xlsx_rows_to_dicts
+from enseignants import Enseignants, Enseignant, Souhaits
 from configuration import Configuration
 from assignements import Assignements
 from datetime import datetime
-from pdf_generation.surveillance_report import create_surveillance_report, create_enseignant_emploi
+from collections import Counter, defaultdict
+from pdf_generation.surveillance_report import create_surveillance_report, create_enseignant_emploi, prewarm as prewarm_pdf_generation
+
+# Report endpoints log their stack traces at DEBUG, so they are only formatted when debug logging is enabled
+logger = logging.getLogger(__name__)
 
-# Initialize Eel with the web directory
-eel.init('web')
+# Optional faster JSON encoder for Eel responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _orjson_safe_json(obj):
+    """Replacement for eel._safe_json: unserializable values become null, like Eel's default encoder"""
+    return orjson.dumps(obj, default=lambda o: None, option=orjson.OPT_NON_STR_KEYS).decode()
 
 def convert_date_format(date_str, from_format='%Y-%m-%d', to_format='%d/%m/%Y'):
     """Convert date format between different formats"""
     try:
-        date_obj = datetime.strptime(date_str, from_format)
+        date_obj = parse_date(date_str, from_format)
         return date_obj.strftime(to_format)
     except ValueError:
         return date_str  # Return original if conversion fails
 
+# Quiet period after the last edit before the state is written, coalescing bursts of edits into a single write
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# Read buffer for state files so pickle.load does a few large reads instead of many small ones
+STATE_READ_BUFFER_SIZE = 1024 * 1024
+
+_save_requested = threading.Event()
+_save_lock = threading.Lock()
+
+# Each part of the application state is pickled to its own file, so a save only rewrites the parts that changed
+STATE_FILES = {
+    'seances_data': 'data/seances_state.pkl',
+    'enseignants_data': 'data/enseignants_state.pkl',
+    'configuration_data': 'data/configuration.pkl',
+    'assignements_data': 'data/assignements_state.pkl',
+}
+
+# Single-file state written by older versions, still read when no per-part files exist
+LEGACY_STATE_FILE = 'data/current_state.pkl'
+
+# Names of the STATE_FILES entries modified since the last save
+_dirty_state = set()
+_dirty_lock = threading.Lock()
+
+def _atomic_pickle_dump(obj, path):
+    """Pickle obj to a temporary file next to path, then atomically replace path"""
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+def _pickle_load(path):
+    """Unpickle a state file"""
+    with open(path, 'rb', buffering=STATE_READ_BUFFER_SIZE) as f:
+        return pickle.load(f)
+
 def save_current_state():
-    """Save current application state to temporary files"""
-    global seances_data, enseignants_data, configuration_data, assignements_data
-    try:
-        os.makedirs('data', exist_ok=True)
+    """Save the modified parts of the application state to their files"""
+    global _dirty_state
+    with _save_lock:
+        with _dirty_lock:
+            dirty, _dirty_state = _dirty_state, set()
         
-        # Save all application state in a single pickle file
-        app_state = {
-            'seances_data': seances_data,
-            'enseignants_data': enseignants_data,
-            'configuration_data': configuration_data,
-            'assignements_data': assignements_data
-        }
-        
-        with open('data/current_state.pkl', 'wb') as f:
-            pickle.dump(app_state, f)
-        
-        # Also save configuration separately for backwards compatibility
-        if configuration_data:
-            with open('data/configuration.pkl', 'wb') as f:
-                pickle.dump(configuration_data, f)
-            
-    except Exception as e:
-        print(f"Warning: Could not save current state: {e}")
+        try:
+            os.makedirs('data', exist_ok=True)
+            
+            for name in dirty:
+                value = globals()[name]
+                path = STATE_FILES[name]
+                if value is not None:
+                    _atomic_pickle_dump(value, path)
+                elif os.path.exists(path):
+                    os.remove(path)
+            
+            # Once every part has its own file the old single-file state is obsolete
+            if dirty.issuperset(STATE_FILES) and os.path.exists(LEGACY_STATE_FILE):
+                os.remove(LEGACY_STATE_FILE)
+        except Exception as e:
+            # Keep these parts marked as modified so the next save retries them
+            with _dirty_lock:
+                _dirty_state.update(dirty)
+            print(f"Warning: Could not save current state: {e}")
+
+def schedule_save(*names):
+    """Mark parts of the application state (STATE_FILES names, default all) as modified; the background saver writes them shortly after"""
+    invalidate_state_caches(*names)
+    with _dirty_lock:
+        _dirty_state.update(names or STATE_FILES)
+    _save_requested.set()
+
+def flush_pending_save():
+    """Synchronously write the application state if a save is still pending"""
+    _save_requested.clear()
+    # The background saver may already have consumed the request while waiting for the burst to end
+    if _dirty_state:
+        save_current_state()
+
+def _background_saver():
+    """Write the application state once per burst of modifications"""
+    while True:
+        _save_requested.wait()
+        # Wait until no edit has arrived for SAVE_DEBOUNCE_SECONDS, so a long burst is written only once.
+        # Clearing before each wait means an edit made while pickling schedules another write
+        while _save_requested.is_set():
+            _save_requested.clear()
+            time.sleep(SAVE_DEBOUNCE_SECONDS)
+        save_current_state()
+
+# Incremented on every state modification; derived data is cached against it
+_state_version = 0
+_state_cache = {}
+
+# Incremented when the corresponding part of the state is modified; see cached_for_parts
+_part_versions = dict.fromkeys(STATE_FILES, 0)
+_parts_cache = {}
+
+def invalidate_state_caches(*names):
+    """Discard every value cached by cached_for_state, and those cached by cached_for_parts for the given STATE_FILES names (default all)"""
+    global _state_version
+    _state_version += 1
+    # Keys can be per date or per teacher, so drop stale entries rather than letting them pile up
+    _state_cache.clear()
+    for name in names or STATE_FILES:
+        _part_versions[name] += 1
+
+def cached_for_state(key, compute):
+    """Return compute() for key, reusing the previous result until the state is modified. Callers must not modify it"""
+    entry = _state_cache.get(key)
+    if entry is not None and entry[0] == _state_version:
+        return entry[1]
+    value = compute()
+    _state_cache[key] = (_state_version, value)
+    return value
+
+def cached_for_parts(key, names, compute):
+    """Return compute() for key, reusing the previous result until one of the given STATE_FILES parts is modified. Callers must not modify it"""
+    versions = tuple(_part_versions[name] for name in names)
+    entry = _parts_cache.get(key)
+    if entry is not None and entry[0] == versions:
+        return entry[1]
+    value = compute()
+    _parts_cache[key] = (versions, value)
+    return value
 
 def load_current_state():
-    """Load complete application state from temporary file"""
+    """Load application state from the per-part state files, or from the older single-file format"""
     try:
-        if os.path.exists('data/current_state.pkl'):
-            with open('data/current_state.pkl', 'rb') as f:
-                app_state = pickle.load(f)
-                
-                # Check if it's the new format (dict with all data) or old format (just seances)
-                if isinstance(app_state, dict) and 'seances_data' in app_state:
-                    # Ensure all expected keys exist for backwards compatibility
-                    if 'assignements_data' not in app_state:
-                        app_state['assignements_data'] = None
-                    return app_state
-                else:
-                    # Old format - just seances data
-                    return {
-                        'seances_data': app_state, 
-                        'enseignants_data': None, 
-                        'configuration_data': None,
-                        'assignements_data': None
-                    }
+        if any(os.path.exists(STATE_FILES[name]) for name in ('seances_data', 'enseignants_data', 'assignements_data')):
+            return {
+                name: _pickle_load(path) if os.path.exists(path) else None
+                for name, path in STATE_FILES.items()
+            }
+        
+        if os.path.exists(LEGACY_STATE_FILE):
+            app_state = _pickle_load(LEGACY_STATE_FILE)
+            
+            # Check if it's the new format (dict with all data) or old format (just seances)
+            if isinstance(app_state, dict) and 'seances_data' in app_state:
+                # Ensure all expected keys exist for backwards compatibility
+                if 'assignements_data' not in app_state:
+                    app_state['assignements_data'] = None
+                return app_state
+            else:
+                # Old format - just seances data
+                return {
+                    'seances_data': app_state, 
+                    'enseignants_data': None, 
+                    'configuration_data': None,
+                    'assignements_data': None
+                }
     except Exception as e:
         print(f"Warning: Could not load current state: {e}")
     return None
 
+def _file_signature(path):
+    """Get (size, mtime) for a file, or None if it is missing, to tell whether it was rewritten since"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+def _load_enseignants_cached(path):
+    """Load teachers from a CSV or XLSX file, reusing a pickled copy stored next to it while the file is unchanged"""
+    cache_path = f'{path}.pkl'
+    signature = _file_signature(path)
+    if os.path.exists(cache_path):
+        try:
+            # The cache holds (signature of the source file, teachers); any other size or mtime means the file was replaced
+            cached = _pickle_load(cache_path)
+            if isinstance(cached, tuple) and cached[0] == signature:
+                return cached[1]
+        except Exception as e:
+            print(f"Warning: Could not load cached teachers {cache_path}: {e}")
+    
+    enseignants = Enseignants.from_csv(path)
+    try:
+        _atomic_pickle_dump((signature, enseignants), cache_path)
+    except Exception as e:
+        print(f"Warning: Could not cache teachers to {cache_path}: {e}")
+    return enseignants
+
 def load_configuration_state():
     """Load configuration state from temporary file"""
     try:
-        if os.path.exists('data/configuration.pkl'):
-            with open('data/configuration.pkl', 'rb') as f:
-                return pickle.load(f)
+        if os.path.exists(STATE_FILES['configuration_data']):
+            return _pickle_load(STATE_FILES['configuration_data'])
     except Exception as e:
         print(f"Warning: Could not load configuration state: {e}")
     return Configuration()  # Return default configuration if none exists
@@ -89,6 +245,34 @@ enseignants_data = None
 configuration_data = None
 assignements_data = None
 
+# Response of the assignment endpoints before initialize_assignments, shared since Eel only serializes it
+ASSIGNMENTS_NOT_INITIALIZED_ERROR = {
+    'success': False,
+    'error': 'Assignments system not initialized'
+}
+
+# Path of the last imported teachers file, reloaded when no teachers are in memory
+ENSEIGNANTS_ORIGINAL_PATH = 'data/enseignants.csv'
+
+def _ensure_configuration():
+    """Load the saved configuration (or a default one) if none is in memory"""
+    global configuration_data
+    if not configuration_data:
+        configuration_data = load_configuration_state()
+        invalidate_state_caches('configuration_data')
+    return configuration_data
+
+def _ensure_enseignants():
+    """Load the teachers from the last imported file (or start empty) if none are in memory"""
+    global enseignants_data
+    if not enseignants_data:
+        if os.path.exists(ENSEIGNANTS_ORIGINAL_PATH):
+            enseignants_data = _load_enseignants_cached(ENSEIGNANTS_ORIGINAL_PATH)
+        else:
+            enseignants_data = Enseignants()
+        invalidate_state_caches('enseignants_data')
+    return enseignants_data
+
 @eel.expose
 def initialize_app():
     """Initialize the application, loading previous state if available"""
@@ -112,22 +296,18 @@ def initialize_app():
             configuration_data = None
             assignements_data = None
         
-        # Load configuration if not loaded from state
-        if not configuration_data:
-            configuration_data = load_configuration_state()
-            
-        # Load enseignants if not loaded from state
-        if not enseignants_data:
-            enseignants_original_path = 'data/enseignants.csv'
-            
-            if os.path.exists(enseignants_original_path):
-                # Load from original import file
-                enseignants_data = Enseignants.from_csv(enseignants_original_path)
-            else:
-                enseignants_data = Enseignants()
+        # Load configuration and enseignants if not loaded from state
+        _ensure_configuration()
+        _ensure_enseignants()
+        
+        # Assignements is pickled without its shared references; point it back at the loaded data
+        if assignements_data is not None:
+            assignements_data.enseignants = enseignants_data
+            assignements_data.seances = seances_data
+            assignements_data.configuration = configuration_data
         
         # Always save the current state to ensure enseignants_data is persisted in pickle
-        save_current_state()
+        schedule_save()
             
         return {
             'success': True,
@@ -136,7 +316,7 @@ def initialize_app():
                 'exam_type': seances_data.exam_type,
                 'session': seances_data.session,
                 'dates': seances_data.dates,
-                'total_sessions': sum(len(sessions) for sessions in seances_data.date_seances.values())
+                'total_sessions': seances_data.get_total_sessions()
             },
             'enseignants_count': len(enseignants_data.enseignants_list)
         }
@@ -146,6 +326,17 @@ def initialize_app():
             'error': str(e)
         }
 
+@eel.expose
+def flush_state():
+    """Write any edits still waiting for the background saver, e.g. before the UI closes"""
+    flush_pending_save()
+    if _dirty_state:
+        return {
+            'success': False,
+            'error': 'Could not save the current state'
+        }
+    return {'success': True}
+
 @eel.expose
 def get_available_dates():
     """Get all available exam dates"""
@@ -157,6 +348,10 @@ def get_available_dates():
 @eel.expose
 def get_seances_for_date(date):
     """Get all seances for a specific date"""
+    return cached_for_state(('seances_for_date', date), lambda: _build_seances_for_date(date))
+
+def _build_seances_for_date(date):
+    """Build the get_seances_for_date payload, converting each seance's sets to lists"""
     global seances_data
     if not seances_data or date not in seances_data.date_seances:
         return []
@@ -187,33 +382,21 @@ def add_seance_to_date(date, h_debut, h_fin, salles=None, enseignants=None):
         
         # Add rooms if provided
         if salles:
-            for salle in salles:
-                if salle.strip():
-                    new_seance.add_salle(salle.strip())
+            new_seance.add_salles(salle.strip() for salle in salles if salle.strip())
         
-        # Add teachers if provided
+        # Add teachers if provided, converting numeric strings to codes
         if enseignants:
-            for enseignant in enseignants:
-                if isinstance(enseignant, str) and enseignant.strip():
-                    # Try to convert to int if it's a numeric string
-                    try:
-                        enseignant_code = int(enseignant.strip())
-                        new_seance.add_enseignant(enseignant_code)
-                    except ValueError:
-                        # If it's not numeric, add as string (convert to int later if needed)
-                        new_seance.add_enseignant(int(enseignant.strip()))
-                elif isinstance(enseignant, int):
-                    new_seance.add_enseignant(enseignant)
-        
-        # Add to seances data
-        seances_data.add_seance(date, new_seance)
-        
-        # Sort seances by start time
-        if date in seances_data.date_seances:
-            seances_data.date_seances[date].sort(key=lambda s: s.h_debut)
+            new_seance.add_enseignants([
+                int(enseignant.strip()) if isinstance(enseignant, str) else enseignant
+                for enseignant in enseignants
+                if isinstance(enseignant, int) or (isinstance(enseignant, str) and enseignant.strip())
+            ])
+        
+        # Add to seances data, keeping seances sorted by start time
+        seances_data.insert_seance(date, new_seance)
         
         # Save current state
-        save_current_state()
+        schedule_save('seances_data')
             
         return {
             'success': True,
@@ -238,6 +421,7 @@ def update_seance(date, index, h_debut, h_fin, salles, enseignants):
             return {'success': False, 'error': 'Seance index out of range'}
             
         seance = seances_data.date_seances[date][index]
+        start_changed = seance.h_debut != h_debut
         
         # Update seance properties
         seance.h_debut = h_debut
@@ -245,22 +429,22 @@ def update_seance(date, index, h_debut, h_fin, salles, enseignants):
         
         # Update salles
         seance.salles.clear()
-        for salle in salles:
-            seance.add_salle(salle.strip())
+        seance.add_salles(salle.strip() for salle in salles)
             
         # Update enseignants
-        seance.enseignants.clear()
-        for enseignant in enseignants:
-            if isinstance(enseignant, str) and enseignant.isdigit():
-                seance.add_enseignant(int(enseignant))
-            elif isinstance(enseignant, int):
-                seance.add_enseignant(enseignant)
+        seance.responsables.clear()
+        seance.add_enseignants([
+            int(enseignant) if isinstance(enseignant, str) else enseignant
+            for enseignant in enseignants
+            if isinstance(enseignant, int) or (isinstance(enseignant, str) and enseignant.isdigit())
+        ])
                 
-        # Re-sort seances by start time
-        seances_data.date_seances[date].sort(key=lambda s: s.h_debut)
+        # Move the seance back into start time order; assignments are indexed by position, so only when its start moved
+        if start_changed:
+            seances_data.reposition_seance(date, index)
         
         # Save current state
-        save_current_state()
+        schedule_save('seances_data')
         
         return {
             'success': True,
@@ -284,17 +468,11 @@ def delete_seance(date, index):
         if index >= len(seances_data.date_seances[date]):
             return {'success': False, 'error': 'Seance index out of range'}
             
-        # Remove the seance
-        del seances_data.date_seances[date][index]
-        
-        # If no seances left for this date, remove the date
-        if not seances_data.date_seances[date]:
-            del seances_data.date_seances[date]
-            if date in seances_data.dates:
-                seances_data.dates.remove(date)
+        # Remove the seance, and the date if no seances are left for it
+        seances_data.remove_seance(date, index)
         
         # Save current state
-        save_current_state()
+        schedule_save('seances_data')
                 
         return {
             'success': True,
@@ -318,14 +496,9 @@ def add_exam_date(date):
         # Convert date from HTML input format (YYYY-MM-DD) to DD/MM/YYYY
         formatted_date = convert_date_format(date, '%Y-%m-%d', '%d/%m/%Y')
             
-        if formatted_date not in seances_data.dates:
-            seances_data.dates.append(formatted_date)
-            # Sort dates properly by converting to datetime objects
-            seances_data.dates.sort(key=lambda x: datetime.strptime(x, '%d/%m/%Y'))
-            seances_data.date_seances[formatted_date] = []
-            
+        if seances_data.add_date(formatted_date):
             # Save current state
-            save_current_state()
+            schedule_save('seances_data')
             
         return {
             'success': True,
@@ -347,14 +520,9 @@ def remove_exam_date(date):
         if not seances_data:
             return {'success': False, 'error': 'No seances data available'}
             
-        if date in seances_data.dates:
-            seances_data.dates.remove(date)
-            
-        if date in seances_data.date_seances:
-            del seances_data.date_seances[date]
-        
-        # Save current state
-        save_current_state()
+        # Save current state only if the date was actually there
+        if seances_data.remove_date(date):
+            schedule_save('seances_data')
             
         return {
             'success': True,
@@ -381,147 +549,114 @@ def get_seances_summary():
             'seances_by_date': {}
         }
         
-    return seances_data.to_dict()
+    return cached_for_state('seances_summary', seances_data.to_dict)
+
+# Columns a seances file must contain, in the order listed in error messages
+SEANCES_REQUIRED_COLUMNS = ('dateExam', 'h_debut', 'h_fin', 'session', 'type ex', 'semestre', 'enseignant', 'cod_salle')
+
+def _read_import_rows(stream, file_ext, required_columns):
+    """Validate the header of a CSV or XLSX stream against required_columns and return its data rows as dictionaries"""
+    # Validate file format by reading the header row
+    if file_ext == '.csv':
+        # The header check and the data rows share a single parse of the content
+        reader = csv.DictReader(stream)
+        header = reader.fieldnames or []
+        
+        # Check if it has the required columns
+        if not set(header).issuperset(required_columns):
+            raise ValueError(f'Invalid CSV format. Required columns: {", ".join(required_columns)}')
+        
+        return list(reader)
+    elif file_ext == '.xlsx':
+        # Parse the workbook once: validate its header row, then keep reading data rows from the same iterator
+        sheet_rows = iter_xlsx_rows(stream)
+        try:
+            try:
+                headers = list(next(sheet_rows, ()))
+            except ImportError:
+                raise ImportError('openpyxl library is required for Excel files. Please install it.')
+            except Exception as e:
+                raise ValueError(f'Error reading XLSX file: {str(e)}')
+            
+            # Clean headers - remove extra whitespace and convert to string
+            header = [str(h).strip() for h in headers if h is not None]
+            
+            # Check if it has the required columns
+            header_set = set(header)
+            missing_columns = [col for col in required_columns if col not in header_set]
+            
+            if missing_columns:
+                raise ValueError(f'Invalid XLSX format. Missing columns: {", ".join(missing_columns)}. Found columns: {", ".join(header)}')
+            
+            return xlsx_rows_to_dicts(headers, sheet_rows)
+        finally:
+            # Release the workbook as soon as it has been read, including on validation errors
+            sheet_rows.close()
+    else:
+        raise ValueError(f'Unsupported file format: {file_ext}. Only .csv and .xlsx are supported.')
+
+def _import_seances(stream, file_ext):
+    """Validate the header of a CSV or XLSX stream, then load seances from it, replacing all existing data"""
+    global seances_data
+    
+    # Load seances, replacing all existing data
+    seances_data = Seances.from_rows(_read_import_rows(stream, file_ext, SEANCES_REQUIRED_COLUMNS))
+    
+    # Save the imported state
+    schedule_save('seances_data')
+    
+    return {
+        'success': True,
+        'message': 'Seances data imported successfully',
+        'seances_info': {
+            'semester': seances_data.semester,
+            'exam_type': seances_data.exam_type,
+            'session': seances_data.session,
+            'dates': seances_data.dates,
+            'total_sessions': seances_data.get_total_sessions()
+        }
+    }
 
 @eel.expose
 def import_seances_from_csv():
     """Import seances data from CSV file, replacing all existing data"""
-    global seances_data
-    
     try:
         seances_csv_path = 'data/seances.csv'
         if not os.path.exists(seances_csv_path):
             return {'success': False, 'error': f'CSV file not found: {seances_csv_path}'}
-            
-        # Load seances from CSV, replacing all existing data
-        seances_data = Seances.from_csv(seances_csv_path)
-        
-        # Save the imported state
-        save_current_state()
         
-        return {
-            'success': True,
-            'message': 'Seances data imported successfully',
-            'seances_info': {
-                'semester': seances_data.semester,
-                'exam_type': seances_data.exam_type,
-                'session': seances_data.session,
-                'dates': seances_data.dates,
-                'total_sessions': sum(len(sessions) for sessions in seances_data.date_seances.values())
-            }
-        }
+        with open(seances_csv_path, 'r', encoding='utf-8') as f:
+            return _import_seances(f, '.csv')
     except Exception as e:
         return {
             'success': False,
             'error': str(e)
         }
 
+def _open_uploaded_content(file_content, file_ext):
+    """Wrap uploaded file content in a stream. The frontend sends XLSX files base64-encoded and CSV files as text"""
+    if file_ext == '.xlsx':
+        return io.BytesIO(base64.b64decode(file_content))
+    return io.StringIO(file_content)
+
 @eel.expose
 def import_seances_from_file_content(file_content, filename):
     """Import seances data from CSV or XLSX file content, replacing all existing data"""
-    global seances_data
-    
     try:
-        # Create temporary file from content
-        os.makedirs('data', exist_ok=True)
-        
         # Determine file type from filename
         file_ext = os.path.splitext(filename)[1].lower()
-        temp_file_path = f'data/temp_import{file_ext}'
-        
-        # Write content to temporary file
-        if file_ext == '.xlsx':
-            # For XLSX files, content should be binary
-            import base64
-            if isinstance(file_content, str):
-                # If it's base64 encoded, decode it
-                try:
-                    file_content = base64.b64decode(file_content)
-                except:
-                    pass
-            with open(temp_file_path, 'wb') as f:
-                f.write(file_content)
-        else:
-            # For CSV files, content is text
-            with open(temp_file_path, 'w', encoding='utf-8') as f:
-                f.write(file_content)
-        
-        # Validate file format by reading first few lines/rows
-        if file_ext == '.csv':
-            with open(temp_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                header = next(reader)
-                
-                # Check if it has the required columns
-                required_columns = ['dateExam', 'h_debut', 'h_fin', 'session', 'type ex', 'semestre', 'enseignant', 'cod_salle']
-                if not all(col in header for col in required_columns):
-                    return {
-                        'success': False, 
-                        'error': f'Invalid CSV format. Required columns: {", ".join(required_columns)}'
-                    }
-        elif file_ext == '.xlsx':
-            try:
-                import openpyxl
-                workbook = openpyxl.load_workbook(temp_file_path)
-                sheet = workbook.active
-                header = [cell.value for cell in sheet[1] if cell.value is not None]
-                workbook.close()
-                
-                # Clean headers - remove extra whitespace and convert to string
-                header = [str(h).strip() for h in header if h is not None]
-                
-                # Check if it has the required columns
-                required_columns = ['dateExam', 'h_debut', 'h_fin', 'session', 'type ex', 'semestre', 'enseignant', 'cod_salle']
-                missing_columns = [col for col in required_columns if col not in header]
-                
-                if missing_columns:
-                    return {
-                        'success': False, 
-                        'error': f'Invalid XLSX format. Missing columns: {", ".join(missing_columns)}. Found columns: {", ".join(header)}'
-                    }
-            except ImportError:
-                return {
-                    'success': False, 
-                    'error': 'openpyxl library is required for Excel files. Please install it.'
-                }
-            except Exception as e:
-                return {
-                    'success': False, 
-                    'error': f'Error reading XLSX file: {str(e)}'
-                }
-        else:
+        
+        # Reject unsupported files before decoding or parsing their content
+        if file_ext not in ('.csv', '.xlsx'):
             return {
                 'success': False, 
                 'error': f'Unsupported file format: {file_ext}. Only .csv and .xlsx are supported.'
             }
         
-        # Load seances from temporary file, replacing all existing data
-        seances_data = Seances.from_csv(temp_file_path)
-        
-        # Clean up temporary file
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-        
-        # Save the imported state
-        save_current_state()
+        stream = _open_uploaded_content(file_content, file_ext)
         
-        return {
-            'success': True,
-            'message': 'Seances data imported successfully',
-            'seances_info': {
-                'semester': seances_data.semester,
-                'exam_type': seances_data.exam_type,
-                'session': seances_data.session,
-                'dates': seances_data.dates,
-                'total_sessions': sum(len(sessions) for sessions in seances_data.date_seances.values())
-            }
-        }
+        return _import_seances(stream, file_ext)
     except Exception as e:
-        # Clean up temporary file in case of error
-        temp_file_path = f'data/temp_import{file_ext if "file_ext" in locals() else ".csv"}'
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-        
         return {
             'success': False,
             'error': str(e)
@@ -530,62 +665,37 @@ def import_seances_from_file_content(file_content, filename):
 @eel.expose
 def import_seances_from_csv_content(csv_content):
     """Import seances data from CSV content, replacing all existing data"""
-    global seances_data
-    
     try:
-        # Create temporary CSV file from content
-        os.makedirs('data', exist_ok=True)
-        temp_csv_path = 'data/temp_import.csv'
-        
-        # Write content to temporary file
-        with open(temp_csv_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-        
-        # Validate CSV format by reading first few lines
-        with open(temp_csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)
-            
-            # Check if it has the required columns
-            required_columns = ['dateExam', 'h_debut', 'h_fin', 'session', 'type ex', 'semestre', 'enseignant', 'cod_salle']
-            if not all(col in header for col in required_columns):
-                return {
-                    'success': False, 
-                    'error': f'Invalid CSV format. Required columns: {", ".join(required_columns)}'
-                }
-        
-        # Load seances from temporary CSV file, replacing all existing data
-        seances_data = Seances.from_csv(temp_csv_path)
-        
-        # Clean up temporary file
-        if os.path.exists(temp_csv_path):
-            os.remove(temp_csv_path)
-        
-        # Save the imported state
-        save_current_state()
-        
-        return {
-            'success': True,
-            'message': 'Seances data imported successfully',
-            'seances_info': {
-                'semester': seances_data.semester,
-                'exam_type': seances_data.exam_type,
-                'session': seances_data.session,
-                'dates': seances_data.dates,
-                'total_sessions': sum(len(sessions) for sessions in seances_data.date_seances.values())
-            }
-        }
+        return _import_seances(io.StringIO(csv_content), '.csv')
     except Exception as e:
-        # Clean up temporary file in case of error
-        temp_csv_path = 'data/temp_import.csv'
-        if os.path.exists(temp_csv_path):
-            os.remove(temp_csv_path)
-        
         return {
             'success': False,
             'error': str(e)
         }
 
+def get_day_seance_teachers():
+    """Cached seances_data.get_day_seance_teachers_mapping(); callers must not modify it"""
+    return cached_for_state('day_seance_teachers', seances_data.get_day_seance_teachers_mapping)
+
+def invert_slot_mapping(slot_teachers):
+    """Invert a {(day, seance): [teacher codes]} mapping into {teacher code: [(day, seance), ...]}"""
+    teacher_slots = defaultdict(list)
+    for slot, teacher_codes in slot_teachers.items():
+        for code in teacher_codes:
+            teacher_slots[code].append(slot)
+    return dict(teacher_slots)
+
+def get_teacher_slots():
+    """Cached map of teacher code to the (day_index, seance_index) sessions they are responsible for"""
+    return cached_for_state('teacher_slots', lambda: invert_slot_mapping(get_day_seance_teachers()))
+
+def get_surveilling_teachers_with_souhaits():
+    """Cached list of coded teachers who take part in surveillance and have souhaits, the only ones that can conflict"""
+    return cached_for_state('surveilling_with_souhaits', lambda: [
+        enseignant for enseignant in enseignants_data.enseignants_list
+        if enseignant.souhaits and enseignant.participe_surveillance and enseignant.code
+    ])
+
 def detect_teacher_conflicts():
     """Detect conflicts between teacher assignments and their unavailability preferences"""
     global enseignants_data, seances_data
@@ -593,38 +703,42 @@ def detect_teacher_conflicts():
     if not enseignants_data or not seances_data:
         return {}
     
+    return cached_for_state('teacher_conflicts', _compute_teacher_conflicts)
+
+def _compute_teacher_conflicts():
+    """Scan every teacher with souhaits for sessions they are assigned to but unavailable for"""
     conflicts = {}
     
-    # Get day-seance to teacher mapping
-    day_seance_teachers = seances_data.get_day_seance_teachers_mapping()
+    # Sessions each teacher is assigned to, so only their own sessions are checked
+    teacher_slots = get_teacher_slots()
     
     # For each teacher with souhaits, check if they're assigned to sessions they're unavailable for
-    for enseignant in enseignants_data.enseignants_list:
-        if not enseignant.souhaits or not enseignant.participe_surveillance:
+    for enseignant in get_surveilling_teachers_with_souhaits():
+        slots = teacher_slots.get(enseignant.code, ())
+        
+        # day_index is 0-based, but souhaits use 1-based day numbers
+        unavailable = enseignant.get_unavailable_slots_among((day_index + 1, seance_index + 1) for day_index, seance_index in slots)
+        if not unavailable:
             continue
-            
+        
         teacher_conflicts = []
         
-        # Check each day-seance combination
-        for (day_index, seance_index), teacher_codes in day_seance_teachers.items():
-            # Check if this teacher is assigned to this session
-            if enseignant.code and enseignant.code in teacher_codes:
-                # Check if teacher is unavailable for this day-session
-                # day_index is 0-based, but souhaits use 1-based day numbers
-                day_number = day_index + 1
-                seance_number = seance_index + 1
-                
-                if not enseignant.is_available(day_number, seance_number):
-                    # Get the actual date for this day_index
-                    date = seances_data.dates[day_index] if day_index < len(seances_data.dates) else f"Day {day_number}"
-                    teacher_conflicts.append({
-                        'day_index': day_index,
-                        'seance_index': seance_index,
-                        'day_number': day_number,
-                        'seance_number': seance_number,
-                        'date': date,
-                        'seance_name': f"S{seance_number}"
-                    })
+        for day_index, seance_index in slots:
+            # Check if teacher is unavailable for this day-session
+            day_number = day_index + 1
+            seance_number = seance_index + 1
+            
+            if (day_number, seance_number) in unavailable:
+                # Get the actual date for this day_index
+                date = seances_data.dates[day_index] if day_index < len(seances_data.dates) else f"Day {day_number}"
+                teacher_conflicts.append({
+                    'day_index': day_index,
+                    'seance_index': seance_index,
+                    'day_number': day_number,
+                    'seance_number': seance_number,
+                    'date': date,
+                    'seance_name': seance_name(seance_number)
+                })
         
         if teacher_conflicts:
             conflicts[enseignant.email] = teacher_conflicts
@@ -678,7 +792,7 @@ def get_conflict_summary():
         enseignant = enseignants_data.get_enseignant_by_email(email)
         if enseignant:
             conflict_list.append({
-                'teacher_name': f"{enseignant.prenom} {enseignant.nom}",
+                'teacher_name': enseignant.full_name,
                 'email': email,
                 'conflicts': teacher_conflicts
             })
@@ -690,10 +804,58 @@ def get_conflict_summary():
         'total_conflicts': total_conflict_count
     }
 
+def get_assignments_by_code():
+    """Cached map of teacher code to the assignment dicts returned by get_teacher_assignments"""
+    return cached_for_state('assignments_by_code', _build_assignments_by_code)
+
+def _build_assignments_by_code():
+    """Build every teacher's assignment list in a single pass over the sessions"""
+    assignments_by_code = defaultdict(list)
+    
+    # Check if we have assignments data, prefer that over seances data
+    if assignements_data and hasattr(assignements_data, 'assignments'):
+        # Use assignment system data, keyed by 1-based day and seance numbers
+        slots = ((day - 1, seance - 1, teacher_ids) for (day, seance), teacher_ids in assignements_data.assignments.items())
+    else:
+        # Fallback to seances data, keyed by 0-based indexes
+        slots = ((day_index, seance_index, teacher_codes) for (day_index, seance_index), teacher_codes in get_day_seance_teachers().items())
+    
+    for day_index, seance_index, teacher_codes in slots:
+        if not teacher_codes:
+            continue
+        
+        day_number = day_index + 1
+        seance_number = seance_index + 1
+        date = seances_data.dates[day_index] if day_index < len(seances_data.dates) else f"Day {day_number}"
+        
+        # Get seance details
+        seance_obj = None
+        if (date in seances_data.date_seances and 
+            seance_index < len(seances_data.date_seances[date])):
+            seance_obj = seances_data.date_seances[date][seance_index]
+        
+        # The same assignment dict is shared by every teacher of this session
+        assignment = {
+            'day_index': day_index,
+            'seance_index': seance_index,
+            'day_number': day_number,
+            'seance_number': seance_number,
+            'date': date,
+            'seance_name': seance_name(seance_number),
+            'h_debut': seance_obj.h_debut if seance_obj else "N/A",
+            'h_fin': seance_obj.h_fin if seance_obj else "N/A",
+            'rooms': list(seance_obj.salles) if seance_obj else []
+        }
+        
+        for code in set(teacher_codes):
+            assignments_by_code[code].append(assignment)
+    
+    return dict(assignments_by_code)
+
 @eel.expose
 def get_teacher_assignments(email):
     """Get all assignments for a specific teacher"""
-    global enseignants_data, seances_data, assignements_data
+    global enseignants_data, seances_data
     
     if not enseignants_data or not seances_data:
         return {'success': False, 'assignments': []}
@@ -703,74 +865,9 @@ def get_teacher_assignments(email):
     if not enseignant or not enseignant.code:
         return {'success': False, 'assignments': []}
     
-    assignments = []
-    
-    # Check if we have assignments data, prefer that over seances data
-    if assignements_data and hasattr(assignements_data, 'assignments'):
-        # Use assignment system data
-        for (day, seance), teacher_ids in assignements_data.assignments.items():
-            if enseignant.code in teacher_ids:
-                day_index = day - 1
-                seance_index = seance - 1
-                date = seances_data.dates[day_index] if day_index < len(seances_data.dates) else f"Day {day}"
-                
-                # Get seance details
-                seance_obj = None
-                if (date in seances_data.date_seances and 
-                    seance_index < len(seances_data.date_seances[date])):
-                    seance_obj = seances_data.date_seances[date][seance_index]
-                
-                h_debut = seance_obj.h_debut if seance_obj else "N/A"
-                h_fin = seance_obj.h_fin if seance_obj else "N/A"
-                salles = list(seance_obj.salles) if seance_obj else []
-                
-                assignments.append({
-                    'day_index': day_index,
-                    'seance_index': seance_index,
-                    'day_number': day,
-                    'seance_number': seance,
-                    'date': date,
-                    'seance_name': f"S{seance}",
-                    'h_debut': h_debut,
-                    'h_fin': h_fin,
-                    'rooms': salles
-                })
-    else:
-        # Fallback to seances data
-        day_seance_teachers = seances_data.get_day_seance_teachers_mapping()
-        
-        # Find all assignments for this teacher
-        for (day_index, seance_index), teacher_codes in day_seance_teachers.items():
-            if enseignant.code in teacher_codes:
-                day_number = day_index + 1
-                seance_number = seance_index + 1
-                date = seances_data.dates[day_index] if day_index < len(seances_data.dates) else f"Day {day_number}"
-                
-                # Get seance details
-                seance_obj = None
-                if (date in seances_data.date_seances and 
-                    seance_index < len(seances_data.date_seances[date])):
-                    seance_obj = seances_data.date_seances[date][seance_index]
-                
-                h_debut = seance_obj.h_debut if seance_obj else "N/A"
-                h_fin = seance_obj.h_fin if seance_obj else "N/A"
-                salles = list(seance_obj.salles) if seance_obj else []
-                
-                assignments.append({
-                    'day_index': day_index,
-                    'seance_index': seance_index,
-                    'day_number': day_number,
-                    'seance_number': seance_number,
-                    'date': date,
-                    'seance_name': f"S{seance_number}",
-                    'h_debut': h_debut,
-                    'h_fin': h_fin,
-                    'rooms': salles
-                })
-    
     return {
         'success': True,
-        'assignments': assignments
+        'assignments': get_assignments_by_code().get(enseignant.code, [])
     }
 
 @eel.expose
@@ -803,7 +900,7 @@ def get_teacher_responsibilities(email):
                         'day_number': day_number,
                         'seance_number': seance_number,
                         'date': date,
-                        'seance_name': f"S{seance_number}",
+                        'seance_name': seance_name(seance_number),
                         'h_debut': seance.h_debut,
                         'h_fin': seance.h_fin,
                         'rooms': list(seance.salles)
@@ -823,37 +920,29 @@ def get_all_teachers_with_assignments():
         if not enseignants_data:
             return {'success': False, 'teachers': []}
         
-        teachers_with_assignments = []
-        
-        for teacher in enseignants_data.enseignants_list:
-            # Get assignments for this teacher
-            assignment_result = get_teacher_assignments(teacher.email)
-            assignments = assignment_result.get('assignments', []) if assignment_result.get('success') else []
-            
-            # Calculate statistics
-            total_assignments = len(assignments)
-            unique_dates = len(set(assignment.get('date') for assignment in assignments))
-            
-            # Get conflicts if available
-            conflicts = teacher.conflicts if hasattr(teacher, 'conflicts') and teacher.conflicts else []
-            
-            teachers_with_assignments.append({
-                'email': teacher.email,
-                'nom': teacher.nom,
-                'prenom': teacher.prenom,
-                'grade': teacher.grade,
-                'code': teacher.code,
-                'participe_surveillance': teacher.participe_surveillance,
-                'has_souhaits': teacher.souhaits is not None,
-                'assignment_count': total_assignments,
-                'unique_dates': unique_dates,
-                'conflicts_count': len(conflicts),
-                'assignments': assignments
-            })
+        # The listing is requested on every navigation; rebuild it only after the state changes
+        return {
+            'success': True,
+            'teachers': cached_for_state('teachers_with_assignments', lambda: _build_teacher_rows(include_assignments=True))
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+@eel.expose
+def get_all_teachers_summary():
+    """Get all teachers with their assignment counts, without the assignment details (see get_teacher_assignments)"""
+    global enseignants_data
+    
+    try:
+        if not enseignants_data:
+            return {'success': False, 'teachers': []}
         
         return {
             'success': True,
-            'teachers': teachers_with_assignments
+            'teachers': cached_for_state('teachers_summary', lambda: _build_teacher_rows(include_assignments=False))
         }
     except Exception as e:
         return {
@@ -861,6 +950,39 @@ def get_all_teachers_with_assignments():
             'error': str(e)
         }
 
+def _build_teacher_rows(include_assignments):
+    """Build the teacher rows of get_all_teachers_with_assignments, or of get_all_teachers_summary without the assignment lists"""
+    teacher_rows = []
+    
+    # Every teacher's assignments, computed in one pass
+    assignments_by_code = get_assignments_by_code() if seances_data else {}
+    
+    for teacher in enseignants_data.enseignants_list:
+        # Get assignments for this teacher
+        assignments = assignments_by_code.get(teacher.code, []) if teacher.code else []
+        
+        # Calculate statistics
+        total_assignments = len(assignments)
+        unique_dates = len({assignment['date'] for assignment in assignments})
+        
+        row = {
+            'email': teacher.email,
+            'nom': teacher.nom,
+            'prenom': teacher.prenom,
+            'grade': teacher.grade,
+            'code': teacher.code,
+            'participe_surveillance': teacher.participe_surveillance,
+            'has_souhaits': teacher.souhaits is not None,
+            'assignment_count': total_assignments,
+            'unique_dates': unique_dates,
+            'conflicts_count': len(teacher.conflicts)
+        }
+        if include_assignments:
+            row['assignments'] = assignments
+        teacher_rows.append(row)
+    
+    return teacher_rows
+
 @eel.expose
 def toggle_teacher_assignment_for_seance(teacher_email, day, seance, assign=True, force_unavailable=False):
     """Toggle a teacher's assignment to a specific seance"""
@@ -868,47 +990,43 @@ def toggle_teacher_assignment_for_seance(teacher_email, day, seance, assign=True
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
-        # Find the teacher
-        teacher = enseignants_data.get_enseignant_by_email(teacher_email)
-        if not teacher or not teacher.code:
-            return {
-                'success': False,
-                'error': 'Teacher not found or has no code'
-            }
+        result = _toggle_teacher_assignment(teacher_email, day, seance, assign, force_unavailable)
+        if result['success']:
+            schedule_save('assignements_data')
+        return result
+    
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+@eel.expose
+def toggle_teacher_assignments_bulk(operations):
+    """Apply several [teacher_email, day, seance, assign(, force_unavailable)] toggles, saving the state once"""
+    global enseignants_data, assignements_data
+    
+    try:
+        if not assignements_data:
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
-        teacher_id = teacher.code
+        results = []
+        for operation in operations:
+            try:
+                results.append(_toggle_teacher_assignment(*operation))
+            except Exception as e:
+                results.append({'success': False, 'error': str(e)})
         
-        if assign:
-            # Use the new assignment method
-            result = assignements_data.assign_teacher_to_seance(day, seance, teacher_id, force_unavailable)
-            if result['success']:
-                save_current_state()
-                return {
-                    'success': True,
-                    'message': f'Teacher {result["teacher_name"]} assigned to Day {day}, S{seance}',
-                    'is_conflict': result.get('is_conflict', False)
-                }
-            else:
-                return result
-        else:
-            # Remove teacher from seance
-            success = assignements_data.remove_teacher_from_seance(day, seance, teacher_id)
-            if success:
-                save_current_state()
-                return {
-                    'success': True,
-                    'message': f'Teacher {teacher.prenom} {teacher.nom} removed from Day {day}, S{seance}'
-                }
-            else:
-                return {
-                    'success': False,
-                    'error': 'Teacher is not assigned to this seance'
-                }
+        # One save for the whole batch
+        if any(result['success'] for result in results):
+            schedule_save('assignements_data')
+        
+        return {
+            'success': True,
+            'results': results
+        }
     
     except Exception as e:
         return {
@@ -916,6 +1034,43 @@ def toggle_teacher_assignment_for_seance(teacher_email, day, seance, assign=True
             'error': str(e)
         }
 
+def _toggle_teacher_assignment(teacher_email, day, seance, assign=True, force_unavailable=False):
+    """Assign or remove a teacher for a seance without saving; returns the toggle_teacher_assignment_for_seance payload"""
+    # Find the teacher
+    teacher = enseignants_data.get_enseignant_by_email(teacher_email)
+    if not teacher or not teacher.code:
+        return {
+            'success': False,
+            'error': 'Teacher not found or has no code'
+        }
+    
+    teacher_id = teacher.code
+    
+    if assign:
+        # Use the new assignment method
+        result = assignements_data.assign_teacher_to_seance(day, seance, teacher_id, force_unavailable)
+        if result['success']:
+            return {
+                'success': True,
+                'message': f'Teacher {result["teacher_name"]} assigned to Day {day}, S{seance}',
+                'is_conflict': result.get('is_conflict', False)
+            }
+        else:
+            return result
+    else:
+        # Remove teacher from seance
+        success = assignements_data.remove_teacher_from_seance(day, seance, teacher_id)
+        if success:
+            return {
+                'success': True,
+                'message': f'Teacher {teacher.full_name} removed from Day {day}, S{seance}'
+            }
+        else:
+            return {
+                'success': False,
+                'error': 'Teacher is not assigned to this seance'
+            }
+
 @eel.expose
 def get_all_assignment_conflicts():
     """Get all assignment conflicts (teachers assigned to unavailable seances)"""
@@ -923,10 +1078,7 @@ def get_all_assignment_conflicts():
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         conflicts = assignements_data.get_all_conflicts()
         return {
@@ -980,7 +1132,6 @@ def add_enseignant(nom, prenom, email, grade, code=None, participe_surveillance=
             except ValueError:
                 return {'success': False, 'error': 'Invalid code format'}
         
-        from enseignants import Enseignant
         new_enseignant = Enseignant(
             nom=nom.strip(),
             prenom=prenom.strip(),
@@ -993,7 +1144,7 @@ def add_enseignant(nom, prenom, email, grade, code=None, participe_surveillance=
         enseignants_data.add_enseignant(new_enseignant)
         
         # Save to pickle
-        save_current_state()
+        schedule_save('enseignants_data')
         
         return {
             'success': True,
@@ -1037,16 +1188,14 @@ def update_enseignant(original_email, nom, prenom, email, grade, code=None, part
         # Update the teacher
         enseignant.nom = nom.strip()
         enseignant.prenom = prenom.strip()
-        enseignant.email = email.strip()
-        enseignant.grade = grade.strip()
-        enseignant.code = parsed_code
         enseignant.participe_surveillance = bool(participe_surveillance)
+        enseignants_data.set_grade(enseignant, grade.strip())
         
-        # Update unique grades
-        enseignants_data.unique_grades.add(grade.strip())
+        # Email and code are indexed, so change them through Enseignants
+        enseignants_data.update_identity(enseignant, email.strip(), parsed_code)
         
         # Save to pickle
-        save_current_state()
+        schedule_save('enseignants_data')
         
         return {
             'success': True,
@@ -1069,34 +1218,34 @@ def delete_enseignant(email):
         if not enseignant:
             return {'success': False, 'error': 'Teacher not found'}
         
-        # Remove from list
-        enseignants_data.enseignants_list.remove(enseignant)
-        
-        # Update unique grades
-        enseignants_data.unique_grades = set(ens.grade for ens in enseignants_data.enseignants_list)
+        # Remove from list, indexes and grade counts
+        enseignants_data.remove_enseignant(enseignant)
         
         # Save to pickle
-        save_current_state()
+        schedule_save('enseignants_data')
         
         return {
             'success': True,
-            'message': f'Teacher {enseignant.prenom} {enseignant.nom} deleted successfully'
+            'message': f'Teacher {enseignant.full_name} deleted successfully'
         }
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
+# Columns a teachers file must contain (also the column order of the CSV export)
+ENSEIGNANTS_REQUIRED_COLUMNS = ('nom_ens', 'prenom_ens', 'email_ens', 'grade_code_ens', 'code_smartex_ens', 'participe_surveillance')
+
 @eel.expose
 def import_enseignants_from_csv():
     """Import teachers from CSV file, replacing existing data"""
     global enseignants_data
     
     try:
-        csv_path = 'data/enseignants.csv'
+        csv_path = ENSEIGNANTS_ORIGINAL_PATH
         if not os.path.exists(csv_path):
             return {'success': False, 'error': f'CSV file not found: {csv_path}'}
         
-        enseignants_data = Enseignants.from_csv(csv_path)
-        save_current_state()
+        enseignants_data = _load_enseignants_cached(csv_path)
+        schedule_save('enseignants_data')
         
         return {
             'success': True,
@@ -1106,153 +1255,45 @@ def import_enseignants_from_csv():
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
+def _import_enseignants(stream, file_ext):
+    """Validate the header of a CSV or XLSX stream, then load teachers from it, replacing existing data"""
+    global enseignants_data
+    
+    enseignants_data = Enseignants.from_rows(_read_import_rows(stream, file_ext, ENSEIGNANTS_REQUIRED_COLUMNS))
+    
+    # Save to pickle
+    schedule_save('enseignants_data')
+    
+    return {
+        'success': True,
+        'message': 'Teachers imported successfully',
+        'count': len(enseignants_data.enseignants_list)
+    }
+
 @eel.expose
 def import_enseignants_from_file_content(file_content, filename):
     """Import teachers from CSV or XLSX file content"""
-    global enseignants_data
-    
     try:
-        # Create temporary file from content
-        os.makedirs('data', exist_ok=True)
-        
         # Determine file type from filename
         file_ext = os.path.splitext(filename)[1].lower()
-        temp_file_path = f'data/temp_enseignants{file_ext}'
-        
-        # Write content to temporary file
-        if file_ext == '.xlsx':
-            # For XLSX files, content should be binary
-            import base64
-            if isinstance(file_content, str):
-                # If it's base64 encoded, decode it
-                try:
-                    file_content = base64.b64decode(file_content)
-                except:
-                    pass
-            with open(temp_file_path, 'wb') as f:
-                f.write(file_content)
-        else:
-            # For CSV files, content is text
-            with open(temp_file_path, 'w', encoding='utf-8') as f:
-                f.write(file_content)
-        
-        # Validate file format by reading first few lines/rows
-        if file_ext == '.csv':
-            from io import StringIO
-            csv_reader = csv.reader(StringIO(file_content))
-            header = next(csv_reader)
-            
-            required_columns = ['nom_ens', 'prenom_ens', 'email_ens', 'grade_code_ens', 'code_smartex_ens', 'participe_surveillance']
-            if not all(col in header for col in required_columns):
-                return {
-                    'success': False, 
-                    'error': f'Invalid CSV format. Required columns: {", ".join(required_columns)}'
-                }
-        elif file_ext == '.xlsx':
-            try:
-                import openpyxl
-                workbook = openpyxl.load_workbook(temp_file_path)
-                sheet = workbook.active
-                header = [cell.value for cell in sheet[1] if cell.value is not None]
-                workbook.close()
-                
-                # Clean headers - remove extra whitespace and convert to string
-                header = [str(h).strip() for h in header if h is not None]
-                
-                required_columns = ['nom_ens', 'prenom_ens', 'email_ens', 'grade_code_ens', 'code_smartex_ens', 'participe_surveillance']
-                missing_columns = [col for col in required_columns if col not in header]
-                
-                if missing_columns:
-                    return {
-                        'success': False, 
-                        'error': f'Invalid XLSX format. Missing columns: {", ".join(missing_columns)}. Found columns: {", ".join(header)}'
-                    }
-            except ImportError:
-                return {
-                    'success': False, 
-                    'error': 'openpyxl library is required for Excel files. Please install it.'
-                }
-            except Exception as e:
-                return {
-                    'success': False, 
-                    'error': f'Error reading XLSX file: {str(e)}'
-                }
-        else:
+        
+        # Reject unsupported files before decoding or parsing their content
+        if file_ext not in ('.csv', '.xlsx'):
             return {
                 'success': False, 
                 'error': f'Unsupported file format: {file_ext}. Only .csv and .xlsx are supported.'
             }
         
-        # Load teachers from temporary file
-        enseignants_data = Enseignants.from_csv(temp_file_path)
-        
-        # Clean up temporary file
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-        
-        # Save to pickle
-        save_current_state()
-        
-        return {
-            'success': True,
-            'message': 'Teachers imported successfully',
-            'count': len(enseignants_data.enseignants_list)
-        }
+        return _import_enseignants(_open_uploaded_content(file_content, file_ext), file_ext)
     except Exception as e:
-        # Clean up temporary file in case of error
-        temp_file_path = f'data/temp_enseignants{file_ext if "file_ext" in locals() else ".csv"}'
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-        
         return {'success': False, 'error': str(e)}
 
 @eel.expose
 def import_enseignants_from_csv_content(csv_content):
     """Import teachers from CSV content"""
-    global enseignants_data
-    
     try:
-        from io import StringIO
-        
-        # Validate CSV format
-        csv_reader = csv.reader(StringIO(csv_content))
-        header = next(csv_reader)
-        
-        required_columns = ['nom_ens', 'prenom_ens', 'email_ens', 'grade_code_ens', 'code_smartex_ens', 'participe_surveillance']
-        if not all(col in header for col in required_columns):
-            return {
-                'success': False, 
-                'error': f'Invalid CSV format. Required columns: {", ".join(required_columns)}'
-            }
-        
-        # Create temporary file
-        os.makedirs('data', exist_ok=True)
-        temp_csv_path = 'data/temp_enseignants.csv'
-        
-        with open(temp_csv_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-        
-        # Load teachers from temporary file
-        enseignants_data = Enseignants.from_csv(temp_csv_path)
-        
-        # Clean up temporary file
-        if os.path.exists(temp_csv_path):
-            os.remove(temp_csv_path)
-        
-        # Save to pickle
-        save_current_state()
-        
-        return {
-            'success': True,
-            'message': 'Teachers imported successfully',
-            'count': len(enseignants_data.enseignants_list)
-        }
+        return _import_enseignants(io.StringIO(csv_content), '.csv')
     except Exception as e:
-        # Clean up temporary file in case of error
-        temp_csv_path = 'data/temp_enseignants.csv'
-        if os.path.exists(temp_csv_path):
-            os.remove(temp_csv_path)
-        
         return {'success': False, 'error': str(e)}
 
 @eel.expose
@@ -1269,7 +1310,7 @@ def clear_all_seances():
             enseignants_data.clear_all_souhaits()
         
         # Save current state
-        save_current_state()
+        schedule_save('seances_data', 'enseignants_data')
         
         return {
             'success': True,
@@ -1287,7 +1328,7 @@ def clear_all_enseignants():
         enseignants_data = Enseignants()
         
         # Save to pickle
-        save_current_state()
+        schedule_save('enseignants_data')
         
         return {
             'success': True,
@@ -1305,22 +1346,22 @@ def export_enseignants_csv():
         if not enseignants_data:
             return {'success': False, 'error': 'No teachers data to export'}
         
-        from io import StringIO
-        
-        output = StringIO()
-        fieldnames = ['nom_ens', 'prenom_ens', 'email_ens', 'grade_code_ens', 'code_smartex_ens', 'participe_surveillance']
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        
-        writer.writeheader()
-        for ens in enseignants_data.enseignants_list:
-            writer.writerow({
-                'nom_ens': ens.nom,
-                'prenom_ens': ens.prenom,
-                'email_ens': ens.email,
-                'grade_code_ens': ens.grade,
-                'code_smartex_ens': ens.code if ens.code else '',
-                'participe_surveillance': 'TRUE' if ens.participe_surveillance else 'FALSE'
-            })
+        output = io.StringIO()
+        writer = csv.writer(output)
+        
+        # One tuple per teacher, in ENSEIGNANTS_REQUIRED_COLUMNS order, written in a single writerows call
+        writer.writerow(ENSEIGNANTS_REQUIRED_COLUMNS)
+        writer.writerows(
+            (
+                ens.nom,
+                ens.prenom,
+                ens.email,
+                ens.grade,
+                ens.code if ens.code else '',
+                'TRUE' if ens.participe_surveillance else 'FALSE'
+            )
+            for ens in enseignants_data.enseignants_list
+        )
         
         csv_content = output.getvalue()
         output.close()
@@ -1333,168 +1374,55 @@ def export_enseignants_csv():
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
+# Columns a souhaits file must contain, in the order listed in error messages
+SOUHAITS_REQUIRED_COLUMNS = ('Enseignant', 'Semestre', 'Session', 'Jour', 'Séances')
+
+def _import_souhaits(stream, file_ext):
+    """Validate the header of a CSV or XLSX stream, then load teacher preferences from it, replacing existing souhaits"""
+    if not enseignants_data:
+        return {'success': False, 'error': 'No teachers data available. Please import teachers first.'}
+    
+    if not seances_data:
+        return {'success': False, 'error': 'No seances data available. Please import seances first.'}
+    
+    # Load souhaits (clear existing souhaits first)
+    errors = enseignants_data.load_souhaits_from_rows(
+        _read_import_rows(stream, file_ext, SOUHAITS_REQUIRED_COLUMNS), seances_data, clear_existing=True
+    )
+    
+    # Save updated enseignants data
+    schedule_save('enseignants_data')
+    
+    result = {'success': True, 'message': 'Souhaits imported successfully'}
+    if errors:
+        result['warnings'] = errors
+        
+    return result
+
 @eel.expose
 def import_souhaits_from_file_content(file_content, filename):
     """Import teacher preferences from CSV or XLSX file content"""
-    global enseignants_data, seances_data
-    
     try:
-        if not enseignants_data:
-            return {'success': False, 'error': 'No teachers data available. Please import teachers first.'}
-        
-        if not seances_data:
-            return {'success': False, 'error': 'No seances data available. Please import seances first.'}
-        
-        # Create temporary file from content
-        os.makedirs('data', exist_ok=True)
-        
         # Determine file type from filename
         file_ext = os.path.splitext(filename)[1].lower()
-        temp_file_path = f'data/temp_souhaits{file_ext}'
-        
-        # Write content to temporary file
-        if file_ext == '.xlsx':
-            # For XLSX files, content should be binary
-            import base64
-            if isinstance(file_content, str):
-                # If it's base64 encoded, decode it
-                try:
-                    file_content = base64.b64decode(file_content)
-                except:
-                    pass
-            with open(temp_file_path, 'wb') as f:
-                f.write(file_content)
-        else:
-            # For CSV files, content is text
-            with open(temp_file_path, 'w', encoding='utf-8') as f:
-                f.write(file_content)
-        
-        # Validate file format by reading first few lines/rows
-        if file_ext == '.csv':
-            from io import StringIO
-            csv_reader = csv.reader(StringIO(file_content))
-            header = next(csv_reader)
-            
-            required_columns = ['Enseignant', 'Semestre', 'Session', 'Jour', 'Séances']
-            if not all(col in header for col in required_columns):
-                return {
-                    'success': False, 
-                    'error': f'Invalid CSV format. Required columns: {", ".join(required_columns)}'
-                }
-        elif file_ext == '.xlsx':
-            try:
-                import openpyxl
-                workbook = openpyxl.load_workbook(temp_file_path)
-                sheet = workbook.active
-                header = [cell.value for cell in sheet[1] if cell.value is not None]
-                workbook.close()
-                
-                # Clean headers - remove extra whitespace and convert to string
-                header = [str(h).strip() for h in header if h is not None]
-                
-                required_columns = ['Enseignant', 'Semestre', 'Session', 'Jour', 'Séances']
-                missing_columns = [col for col in required_columns if col not in header]
-                
-                if missing_columns:
-                    return {
-                        'success': False, 
-                        'error': f'Invalid XLSX format. Missing columns: {", ".join(missing_columns)}. Found columns: {", ".join(header)}'
-                    }
-            except ImportError:
-                return {
-                    'success': False, 
-                    'error': 'openpyxl library is required for Excel files. Please install it.'
-                }
-            except Exception as e:
-                return {
-                    'success': False, 
-                    'error': f'Error reading XLSX file: {str(e)}'
-                }
-        else:
+        
+        # Reject unsupported files before decoding or parsing their content
+        if file_ext not in ('.csv', '.xlsx'):
             return {
                 'success': False, 
                 'error': f'Unsupported file format: {file_ext}. Only .csv and .xlsx are supported.'
             }
         
-        # Load souhaits from temporary file (clear existing souhaits first)
-        errors = enseignants_data.load_souhaits_from_csv(temp_file_path, seances_data, clear_existing=True)
-        
-        # Clean up temporary file
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-        
-        # Save updated enseignants data
-        save_current_state()
-        
-        result = {'success': True, 'message': 'Souhaits imported successfully'}
-        if errors:
-            result['warnings'] = errors
-            
-        return result
-        
+        return _import_souhaits(_open_uploaded_content(file_content, file_ext), file_ext)
     except Exception as e:
-        # Clean up temporary file in case of error
-        temp_file_path = f'data/temp_souhaits{file_ext if "file_ext" in locals() else ".csv"}'
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-        
         return {'success': False, 'error': str(e)}
 
 @eel.expose
 def import_souhaits_from_csv_content(csv_content):
     """Import teacher preferences from CSV content"""
-    global enseignants_data, seances_data
-    
     try:
-        import csv
-        from io import StringIO
-        
-        if not enseignants_data:
-            return {'success': False, 'error': 'No teachers data available. Please import teachers first.'}
-        
-        if not seances_data:
-            return {'success': False, 'error': 'No seances data available. Please import seances first.'}
-        
-        # Validate CSV format
-        csv_reader = csv.reader(StringIO(csv_content))
-        header = next(csv_reader)
-        
-        required_columns = ['Enseignant', 'Semestre', 'Session', 'Jour', 'Séances']
-        if not all(col in header for col in required_columns):
-            return {
-                'success': False, 
-                'error': f'Invalid CSV format. Required columns: {", ".join(required_columns)}'
-            }
-        
-        # Create temporary file
-        os.makedirs('data', exist_ok=True)
-        temp_csv_path = 'data/temp_souhaits.csv'
-        
-        with open(temp_csv_path, 'w', encoding='utf-8') as f:
-            f.write(csv_content)
-        
-        # Load souhaits from temporary file (clear existing souhaits first)
-        errors = enseignants_data.load_souhaits_from_csv(temp_csv_path, seances_data, clear_existing=True)
-        
-        # Clean up temporary file
-        if os.path.exists(temp_csv_path):
-            os.remove(temp_csv_path)
-        
-        # Save updated enseignants data
-        save_current_state()
-        
-        result = {'success': True, 'message': 'Souhaits imported successfully'}
-        if errors:
-            result['warnings'] = errors
-            
-        return result
-        
+        return _import_souhaits(io.StringIO(csv_content), '.csv')
     except Exception as e:
-        # Clean up temporary file in case of error
-        temp_csv_path = 'data/temp_souhaits.csv'
-        if os.path.exists(temp_csv_path):
-            os.remove(temp_csv_path)
-        
         return {'success': False, 'error': str(e)}
 
 @eel.expose
@@ -1544,27 +1472,26 @@ def update_enseignant_souhaits(email, semestre, session, unavailable_slots):
         if not enseignant:
             return {'success': False, 'error': 'Teacher not found'}
         
-        from enseignants import Souhaits
-        
         # Create or update souhaits
         if not enseignant.souhaits:
             enseignant.souhaits = Souhaits(semestre=semestre, session=session)
         else:
             enseignant.souhaits.semestre = semestre
             enseignant.souhaits.session = session
-            enseignant.souhaits.unavailable_slots.clear()
         
-        # Add unavailable slots
-        for slot in unavailable_slots:
-            if isinstance(slot, list) and len(slot) == 2:
-                enseignant.souhaits.add_unavailable_slot(int(slot[0]), int(slot[1]))
+        # Replace the unavailable slots in one go, skipping malformed entries
+        enseignant.souhaits.set_unavailable_slots(
+            (int(slot[0]), int(slot[1]))
+            for slot in unavailable_slots
+            if isinstance(slot, list) and len(slot) == 2
+        )
         
         # Save updated data
-        save_current_state()
+        schedule_save('enseignants_data')
         
         return {
             'success': True,
-            'message': f'Souhaits updated for {enseignant.prenom} {enseignant.nom}'
+            'message': f'Souhaits updated for {enseignant.full_name}'
         }
     except Exception as e:
         return {'success': False, 'error': str(e)}
@@ -1583,33 +1510,36 @@ def get_exam_schedule_for_souhaits():
                 'warning': 'No exam sessions available. Please import seances data first.'
             }
         
-        # Create a mapping of dates to their sessions
-        sessions_by_date = {}
-        for date in seances_data.dates:
-            if date in seances_data.date_seances:
-                sessions = []
-                for i, seance in enumerate(seances_data.date_seances[date]):
-                    sessions.append({
-                        'index': i + 1,  # Session number (1-based)
-                        'h_debut': seance.h_debut,
-                        'h_fin': seance.h_fin,
-                        'name': f'S{i + 1}'
-                    })
-                sessions_by_date[date] = sessions
-            else:
-                sessions_by_date[date] = []
-        
-        return {
-            'success': True,
-            'dates': seances_data.dates,
-            'sessions_by_date': sessions_by_date,
-            'semester': seances_data.semester,
-            'session': seances_data.session,
-            'exam_type': seances_data.exam_type
-        }
+        # Only seance edits change the schedule, so editing souhaits in the calendar keeps it cached
+        return cached_for_parts('exam_schedule_for_souhaits', ('seances_data',), _build_exam_schedule_for_souhaits)
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
+def _build_exam_schedule_for_souhaits():
+    """Build the get_exam_schedule_for_souhaits payload"""
+    # Create a mapping of dates to their sessions
+    sessions_by_date = {
+        date: [
+            {
+                'index': i + 1,  # Session number (1-based)
+                'h_debut': seance.h_debut,
+                'h_fin': seance.h_fin,
+                'name': seance_name(i + 1)
+            }
+            for i, seance in enumerate(seances_data.date_seances.get(date, ()))
+        ]
+        for date in seances_data.dates
+    }
+    
+    return {
+        'success': True,
+        'dates': seances_data.dates,
+        'sessions_by_date': sessions_by_date,
+        'semester': seances_data.semester,
+        'session': seances_data.session,
+        'exam_type': seances_data.exam_type
+    }
+
 @eel.expose
 def clear_all_souhaits():
     """Clear all souhaits for all teachers"""
@@ -1619,10 +1549,9 @@ def clear_all_souhaits():
         if not enseignants_data:
             return {'success': False, 'error': 'No teachers data available'}
         
-        enseignants_data.clear_all_souhaits()
-        
-        # Save updated data
-        save_current_state()
+        # Save updated data if any souhaits were cleared
+        if enseignants_data.clear_all_souhaits():
+            schedule_save('enseignants_data')
         
         return {
             'success': True,
@@ -1648,17 +1577,9 @@ def get_configuration():
     global configuration_data, enseignants_data
     
     try:
-        # Initialize configuration if not available
-        if not configuration_data:
-            configuration_data = load_configuration_state()
-        
-        # Initialize enseignants if not available
-        if not enseignants_data:
-            enseignants_original_path = 'data/enseignants.csv'
-            if os.path.exists(enseignants_original_path):
-                enseignants_data = Enseignants.from_csv(enseignants_original_path)
-            else:
-                enseignants_data = Enseignants()
+        # Initialize configuration and enseignants if not available
+        _ensure_configuration()
+        _ensure_enseignants()
         
         # Get configuration summary with validation
         if enseignants_data:
@@ -1694,8 +1615,8 @@ def set_grade_hours(grade, hours):
         if not configuration_data:
             configuration_data = Configuration()
         
-        configuration_data.set_grade_hours(grade, hours)
-        save_current_state()
+        if configuration_data.set_grade_hours(grade, hours):
+            schedule_save('configuration_data')
         
         return {
             'success': True,
@@ -1721,7 +1642,7 @@ def remove_grade_configuration(grade):
         
         removed = configuration_data.remove_grade(grade)
         if removed:
-            save_current_state()
+            schedule_save('configuration_data')
             return {
                 'success': True,
                 'message': f'Configuration for grade {grade} removed'
@@ -1746,8 +1667,8 @@ def set_teachers_per_room(teachers_per_room):
         if not configuration_data:
             configuration_data = Configuration()
         
-        configuration_data.set_teachers_per_room(teachers_per_room)
-        save_current_state()
+        if configuration_data.set_teachers_per_room(teachers_per_room):
+            schedule_save('configuration_data')
         
         return {
             'success': True,
@@ -1770,8 +1691,8 @@ def set_surplus_teachers_per_room(surplus_teachers_per_room):
         
         # Convert to float
         surplus_teachers_per_room = float(surplus_teachers_per_room)
-        configuration_data.set_surplus_teachers_per_room(surplus_teachers_per_room)
-        save_current_state()
+        if configuration_data.set_surplus_teachers_per_room(surplus_teachers_per_room):
+            schedule_save('configuration_data')
         
         return {
             'success': True,
@@ -1803,10 +1724,10 @@ def get_teacher_requirements():
         
         requirements = configuration_data.calculate_teacher_requirements(seances_data)
         
-        # Convert tuple keys to strings for JSON serialization
+        # Convert tuple keys to "day-seance" strings for JSON serialization
         requirements_serializable = {
-            f"{day}-{seance}": count 
-            for (day, seance), count in requirements.items()
+            '%d-%d' % key: count
+            for key, count in requirements.items()
         }
         
         total_teachers_needed = sum(requirements.values())
@@ -1836,11 +1757,7 @@ def get_total_rooms():
                 'total_rooms': 0
             }
         
-        total_rooms = 0
-        for date in seances_data.dates:
-            date_seances = seances_data.get_seances_by_date(date)
-            for seance in date_seances:
-                total_rooms += len(seance.salles)
+        total_rooms = sum(len(seance.salles) for date_seances in seances_data.date_seances.values() for seance in date_seances)
         
         return {
             'success': True,
@@ -1859,17 +1776,9 @@ def get_surveillance_statistics():
     global configuration_data, seances_data, enseignants_data
     
     try:
-        # Initialize configuration if not available
-        if not configuration_data:
-            configuration_data = load_configuration_state()
-        
-        # Initialize enseignants if not available
-        if not enseignants_data:
-            enseignants_original_path = 'data/enseignants.csv'
-            if os.path.exists(enseignants_original_path):
-                enseignants_data = Enseignants.from_csv(enseignants_original_path)
-            else:
-                enseignants_data = Enseignants()
+        # Initialize configuration and enseignants if not available
+        _ensure_configuration()
+        _ensure_enseignants()
         
         if not enseignants_data:
             return {
@@ -1877,71 +1786,77 @@ def get_surveillance_statistics():
                 'error': 'Enseignants data not available'
             }
         
-        # Calculate available surveillance hours by grade
-        available_surveillance = {}
-        total_available = 0
-        
-        for grade in enseignants_data.unique_grades:
-            # Get teachers of this grade who participate in surveillance
-            grade_teachers = [
-                teacher for teacher in enseignants_data.get_enseignants_by_grade(grade)
-                if teacher.participe_surveillance
-            ]
-            
-            # Get configured surveillance hours for this grade
-            surveillance_hours = configuration_data.get_grade_hours(grade)
-            
-            # Calculate total available surveillance for this grade
-            grade_surveillance = len(grade_teachers) * surveillance_hours
-            available_surveillance[grade] = {
-                'teachers_count': len(grade_teachers),
-                'surveillance_hours': surveillance_hours,
-                'total_surveillance': grade_surveillance
-            }
-            total_available += grade_surveillance
-        
-        # Calculate needed surveillance
-        total_needed = 0
-        total_needed_with_surplus = 0
-        if seances_data:
-            requirements = configuration_data.calculate_teacher_requirements(seances_data)
-            total_needed = sum(requirements.values())
-            
-            # Calculate requirements with surplus
-            requirements_with_surplus = {}
-            for day_idx, date in enumerate(seances_data.dates, 1):
-                date_seances = seances_data.get_seances_by_date(date)
-                for seance_idx, seance in enumerate(date_seances, 1):
-                    num_rooms = len(seance.salles)
-                    # Calculate surplus teachers: rooms * teachers_per_room * surplus_ratio, then round up
-                    basic_teachers = num_rooms * configuration_data.teachers_per_room
-                    surplus_teachers = int(num_rooms * configuration_data.teachers_per_room * configuration_data.surplus_teachers_per_room)
-                    required_teachers_with_surplus = basic_teachers + surplus_teachers
-                    requirements_with_surplus[(day_idx, seance_idx)] = required_teachers_with_surplus
-            
-            total_needed_with_surplus = sum(requirements_with_surplus.values())
-        
-        # Calculate surplus surveillance needed
-        surplus_needed = total_needed_with_surplus - total_needed
-        
-        return {
-            'success': True,
-            'available_surveillance': available_surveillance,
-            'total_available': total_available,
-            'total_needed': total_needed,
-            'total_needed_with_surplus': total_needed_with_surplus,
-            'surplus_needed': surplus_needed,
-            'balance': total_available - total_needed,
-            'balance_with_surplus': total_available - total_needed_with_surplus,
-            'is_sufficient': total_available >= total_needed,
-            'is_sufficient_with_surplus': total_available >= total_needed_with_surplus
-        }
+        # The statistics only change with the configuration, the seances or the teachers, not with assignments
+        return cached_for_parts(
+            'surveillance_statistics',
+            ('configuration_data', 'seances_data', 'enseignants_data'),
+            _compute_surveillance_statistics
+        )
     except Exception as e:
         return {
             'success': False,
             'error': str(e)
         }
 
+def _compute_surveillance_statistics():
+    """Compute the get_surveillance_statistics payload"""
+    # Calculate available surveillance hours by grade
+    available_surveillance = {}
+    total_available = 0
+    
+    # Count participating teachers per grade in a single pass over the teachers
+    participating_by_grade = Counter(
+        teacher.grade for teacher in enseignants_data.enseignants_list
+        if teacher.participe_surveillance
+    )
+    
+    for grade in enseignants_data.unique_grades:
+        teachers_count = participating_by_grade[grade]
+        
+        # Get configured surveillance hours for this grade
+        surveillance_hours = configuration_data.get_grade_hours(grade)
+        
+        # Calculate total available surveillance for this grade
+        grade_surveillance = teachers_count * surveillance_hours
+        available_surveillance[grade] = {
+            'teachers_count': teachers_count,
+            'surveillance_hours': surveillance_hours,
+            'total_surveillance': grade_surveillance
+        }
+        total_available += grade_surveillance
+    
+    # Calculate needed surveillance
+    total_needed = 0
+    total_needed_with_surplus = 0
+    if seances_data:
+        teachers_per_room = configuration_data.teachers_per_room
+        surplus_ratio = configuration_data.surplus_teachers_per_room
+        
+        # One pass over the seances gives both totals (same per-seance figures as calculate_teacher_requirements)
+        for date in seances_data.dates:
+            for seance in seances_data.get_seances_by_date(date):
+                basic_teachers = len(seance.salles) * teachers_per_room
+                # Calculate surplus teachers: rooms * teachers_per_room * surplus_ratio, then round down
+                surplus_teachers = int(basic_teachers * surplus_ratio)
+                total_needed += basic_teachers
+                total_needed_with_surplus += basic_teachers + surplus_teachers
+    
+    # Calculate surplus surveillance needed
+    surplus_needed = total_needed_with_surplus - total_needed
+    
+    return {
+        'success': True,
+        'available_surveillance': available_surveillance,
+        'total_available': total_available,
+        'total_needed': total_needed,
+        'total_needed_with_surplus': total_needed_with_surplus,
+        'surplus_needed': surplus_needed,
+        'balance': total_available - total_needed,
+        'balance_with_surplus': total_available - total_needed_with_surplus,
+        'is_sufficient': total_available >= total_needed,
+        'is_sufficient_with_surplus': total_available >= total_needed_with_surplus
+    }
+
 # Assignments endpoints
 @eel.expose
 def initialize_assignments():
@@ -1978,6 +1893,8 @@ def initialize_assignments():
             # Create new assignments instance only if we don't have existing data
             assignements_data = Assignements(enseignants_data, seances_data, configuration_data)
         
+        invalidate_state_caches()
+        
         return {
             'success': True,
             'message': 'Assignments system initialized successfully'
@@ -1995,50 +1912,39 @@ def get_assignments_overview():
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         summary = assignements_data.get_assignment_summary()
         
+        # Number of rooms per (day, seance), both 1-based, so each detail needs a single lookup
+        rooms_by_seance = {}
+        if seances_data and configuration_data:
+            for day_number, date in enumerate(seances_data.dates, 1):
+                for seance_number, seance in enumerate(seances_data.date_seances.get(date, ()), 1):
+                    rooms_by_seance[(day_number, seance_number)] = len(seance.salles) if seance.salles else 1  # At least 1 room
+            teachers_per_room = configuration_data.teachers_per_room if configuration_data.teachers_per_room else 2  # Default to 2
+        
         # Format seance details for frontend
         seance_details = []
         for detail in summary['seance_details']:
-            # Get teacher names and check for conflicts
+            # Get teacher names and check for conflicts, as flat [id, name, grade, is_conflict] rows
             teacher_names = []
             has_conflicts = False
             for teacher_id in detail['teachers']:
                 teacher = enseignants_data.get_enseignant_by_code(teacher_id)
                 if teacher:
-                    is_conflict = assignements_data.is_assignment_conflict(detail['day'], detail['seance'], teacher_id)
+                    # The teacher is assigned here by construction, so a conflict is just unavailability
+                    is_conflict = not teacher.is_available(detail['day'], detail['seance'])
                     if is_conflict:
                         has_conflicts = True
                     
-                    teacher_names.append({
-                        'id': teacher_id,
-                        'name': f"{teacher.prenom} {teacher.nom}",
-                        'grade': teacher.grade,
-                        'is_conflict': is_conflict
-                    })
+                    teacher_names.append((teacher_id, teacher.full_name, teacher.grade, is_conflict))
             
             # Calculate required teachers based on rooms and configuration
             required_teachers = detail['required']  # Default fallback
-            if seances_data and configuration_data:
-                # Get the actual seance to count rooms
-                day_index = detail['day'] - 1  # Convert to 0-based index
-                seance_index = detail['seance'] - 1  # Convert to 0-based index
-                
-                if (day_index < len(seances_data.dates) and 
-                    day_index >= 0):
-                    date = seances_data.dates[day_index]
-                    if (date in seances_data.date_seances and 
-                        seance_index < len(seances_data.date_seances[date]) and 
-                        seance_index >= 0):
-                        seance = seances_data.date_seances[date][seance_index]
-                        num_rooms = len(seance.salles) if seance.salles else 1  # At least 1 room
-                        teachers_per_room = configuration_data.teachers_per_room if configuration_data.teachers_per_room else 2  # Default to 2
-                        required_teachers = num_rooms * teachers_per_room
+            num_rooms = rooms_by_seance.get((detail['day'], detail['seance']))
+            if num_rooms is not None:
+                required_teachers = num_rooms * teachers_per_room
             
             seance_details.append({
                 'day': detail['day'],
@@ -2076,10 +1982,7 @@ def get_seance_assignments(day, seance):
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         seance_key = (day, seance)
         if seance_key not in assignements_data.assignments:
@@ -2099,7 +2002,7 @@ def get_seance_assignments(day, seance):
                 assigned_teachers.append({
                     'id': teacher_id,
                     'code': teacher.code,
-                    'name': f"{teacher.prenom} {teacher.nom}",
+                    'name': teacher.full_name,
                     'grade': teacher.grade,
                     'email': teacher.email
                 })
@@ -2126,51 +2029,22 @@ def assign_teacher_to_seance_manual(day, seance, teacher_id):
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
-        success = assignements_data.assign_teacher_to_seance(day, seance, teacher_id)
+        result = assignements_data.assign_teacher_to_seance(day, seance, teacher_id)
         
-        if success:
-            save_current_state()  # Save state after assignment
-            teacher = enseignants_data.get_enseignant_by_code(teacher_id)
-            teacher_name = f"{teacher.prenom} {teacher.nom}" if teacher else f"Teacher {teacher_id}"
+        if result['success']:
+            schedule_save('assignements_data')  # Save state after assignment
             
             return {
                 'success': True,
-                'message': f'{teacher_name} assigned to Day {day}, S{seance} successfully'
+                'message': f'{result["teacher_name"]} assigned to Day {day}, S{seance} successfully'
             }
         else:
-            # Get specific error reason
-            teacher = enseignants_data.get_enseignant_by_code(teacher_id)
-            if not teacher:
-                error_msg = 'Teacher not found'
-            elif not teacher.participe_surveillance:
-                error_msg = 'Teacher does not participate in surveillance'
-            elif not teacher.is_available(day, seance):
-                error_msg = 'Teacher is not available for this time slot'
-            elif assignements_data.get_teacher_total_surveillances(teacher_id) >= assignements_data.get_teacher_quota(teacher_id):
-                quota = assignements_data.get_teacher_quota(teacher_id)
-                error_msg = f'Teacher has reached their quota ({quota} hours)'
-            elif teacher_id in assignements_data.assignments.get((day, seance), []):
-                error_msg = 'Teacher is already assigned to this seance'
-            else:
-                seance_key = (day, seance)
-                if seance_key in assignements_data.requirements:
-                    current = len(assignements_data.assignments[seance_key])
-                    required = assignements_data.requirements[seance_key]
-                    if current >= required:
-                        error_msg = 'Seance is already fully staffed'
-                    else:
-                        error_msg = 'Assignment failed for unknown reason'
-                else:
-                    error_msg = 'Invalid seance'
-            
+            # assign_teacher_to_seance already reports why the assignment was refused
             return {
                 'success': False,
-                'error': error_msg
+                'error': result['error']
             }
     except Exception as e:
         return {
@@ -2185,17 +2059,14 @@ def remove_teacher_from_seance_manual(day, seance, teacher_id):
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         success = assignements_data.remove_teacher_from_seance(day, seance, teacher_id)
         
         if success:
-            save_current_state()  # Save state after removal
+            schedule_save('assignements_data')  # Save state after removal
             teacher = enseignants_data.get_enseignant_by_code(teacher_id)
-            teacher_name = f"{teacher.prenom} {teacher.nom}" if teacher else f"Teacher {teacher_id}"
+            teacher_name = teacher.full_name if teacher else f"Teacher {teacher_id}"
             
             return {
                 'success': True,
@@ -2219,20 +2090,17 @@ def auto_assign_teachers():
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         results = assignements_data.auto_assign_teachers()
+        recommendations = results.get('recommendations') or ()
         
         if results['status'] in ['complete_success', 'partial_success']:
-            save_current_state()  # Save state after auto-assignment
+            schedule_save('assignements_data')  # Save state after auto-assignment
             
             # Convert recommendations to strings for frontend
-            recommendations_strings = []
-            for rec in results.get('recommendations', []):
-                recommendations_strings.append({
+            recommendations_strings = [
+                {
                     'type': rec.type.value,
                     'message': rec.to_string(),
                     'day': rec.day,
@@ -2241,7 +2109,9 @@ def auto_assign_teachers():
                     'teacher_name': rec.teacher_name,
                     'current_quota': rec.current_quota,
                     'suggested_quota': rec.suggested_quota
-                })
+                }
+                for rec in recommendations
+            ]
             
             # Build response based on the enhanced result structure
             response = {
@@ -2273,7 +2143,7 @@ def auto_assign_teachers():
             return {
                 'success': False,
                 'error': results.get('error', 'Auto-assignment failed'),
-                'recommendations': [rec.to_string() for rec in results.get('recommendations', [])]
+                'recommendations': [rec.to_string() for rec in recommendations]
             }
     except Exception as e:
         return {
@@ -2288,16 +2158,17 @@ def clear_all_assignments():
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
-        # Clear all assignments
-        for seance_key in assignements_data.assignments:
-            assignements_data.assignments[seance_key] = []
+        # Clear all assignments in place, saving only if there was something to clear
+        changed = False
+        for teacher_ids in assignements_data.assignments.values():
+            if teacher_ids:
+                teacher_ids.clear()
+                changed = True
         
-        save_current_state()  # Save state after clearing
+        if changed:
+            schedule_save('assignements_data')  # Save state after clearing
         
         return {
             'success': True,
@@ -2316,15 +2187,12 @@ def assign_substitutes():
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         results = assignements_data.assign_substitutes()
         
         if results['status'] in ['success', 'complete_success']:
-            save_current_state()  # Save state after substitute assignment
+            schedule_save('assignements_data')  # Save state after substitute assignment
             
             # Build response
             response = {
@@ -2359,6 +2227,51 @@ def assign_substitutes():
             'error': str(e)
         }
 
+def _participating_teacher_rows():
+    """(teacher, identity fields) for teachers who participate in surveillance and have a code, reused until the teachers change. Callers must not modify it"""
+    return cached_for_parts(
+        'participating_teacher_rows',
+        ('enseignants_data',),
+        lambda: [
+            (teacher, {
+                'id': teacher.code,
+                'code': teacher.code,
+                'name': teacher.full_name,
+                'grade': teacher.grade,
+                'email': teacher.email
+            })
+            for teacher in enseignants_data.get_enseignants_participating_surveillance()
+            if teacher.code is not None
+        ]
+    )
+
+def _iter_available_teachers(day, seance):
+    """Yield (identity fields, current surveillances, quota) for each teacher who could be assigned to a seance"""
+    # Teachers already assigned to this seance, as a set for constant-time membership checks
+    assigned_teacher_ids = set(assignements_data.assignments.get((day, seance), ()))
+    # Surveillance totals for every teacher, counted once rather than per teacher
+    surveillance_totals = assignements_data.get_all_teacher_total_surveillances()
+    
+    for teacher, identity in _participating_teacher_rows():
+        teacher_id = teacher.code
+        
+        # Check if teacher is already assigned to this seance
+        if teacher_id in assigned_teacher_ids:
+            continue
+        
+        # Check if teacher is available
+        if not teacher.is_available(day, seance):
+            continue
+        
+        # Check if teacher has quota remaining
+        current_surveillances = surveillance_totals[teacher_id]
+        quota = assignements_data.get_teacher_quota(teacher_id)
+        
+        if current_surveillances >= quota:
+            continue
+        
+        yield identity, current_surveillances, quota
+
 @eel.expose
 def get_available_teachers_for_seance(day, seance):
     """Get list of teachers available for assignment to a specific seance"""
@@ -2366,44 +2279,17 @@ def get_available_teachers_for_seance(day, seance):
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
-        available_teachers = []
-        
-        for teacher in enseignants_data.get_enseignants_participating_surveillance():
-            if teacher.code is None:
-                continue
-            
-            teacher_id = teacher.code
-            
-            # Check if teacher is already assigned to this seance
-            if teacher_id in assignements_data.assignments.get((day, seance), []):
-                continue
-            
-            # Check if teacher is available
-            if not teacher.is_available(day, seance):
-                continue
-            
-            # Check if teacher has quota remaining
-            current_surveillances = assignements_data.get_teacher_total_surveillances(teacher_id)
-            quota = assignements_data.get_teacher_quota(teacher_id)
-            
-            if current_surveillances >= quota:
-                continue
-            
-            available_teachers.append({
-                'id': teacher_id,
-                'code': teacher.code,
-                'name': f"{teacher.prenom} {teacher.nom}",
-                'grade': teacher.grade,
-                'email': teacher.email,
+        available_teachers = [
+            {
+                **identity,
                 'current_surveillances': current_surveillances,
                 'quota': quota,
                 'remaining_surveillances': quota - current_surveillances
-            })
+            }
+            for identity, current_surveillances, quota in _iter_available_teachers(day, seance)
+        ]
         
         return {
             'success': True,
@@ -2415,6 +2301,25 @@ def get_available_teachers_for_seance(day, seance):
             'error': str(e)
         }
 
+@eel.expose
+def count_available_teachers_for_seance(day, seance):
+    """Count the teachers available for assignment to a specific seance, without building their details"""
+    global assignements_data
+    
+    try:
+        if not assignements_data:
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
+        
+        return {
+            'success': True,
+            'count': sum(1 for _ in _iter_available_teachers(day, seance))
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
 @eel.expose
 def get_all_teachers_for_seance(day, seance):
     """Get list of all teachers with their assignment status for a specific seance"""
@@ -2422,33 +2327,26 @@ def get_all_teachers_for_seance(day, seance):
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         all_teachers = []
-        assigned_teacher_ids = assignements_data.assignments.get((day, seance), [])
+        # A set, since every participating teacher is checked against it
+        assigned_teacher_ids = set(assignements_data.assignments.get((day, seance), ()))
+        # Surveillance totals for every teacher, counted once rather than per teacher
+        surveillance_totals = assignements_data.get_all_teacher_total_surveillances()
         
-        for teacher in enseignants_data.get_enseignants_participating_surveillance():
-            if teacher.code is None:
-                continue
-            
+        for teacher, identity in _participating_teacher_rows():
             teacher_id = teacher.code
             is_assigned = teacher_id in assigned_teacher_ids
             
             # Get teacher info
-            current_surveillances = assignements_data.get_teacher_total_surveillances(teacher_id)
+            current_surveillances = surveillance_totals[teacher_id]
             quota = assignements_data.get_teacher_quota(teacher_id)
             is_available = teacher.is_available(day, seance)
             has_quota_remaining = current_surveillances < quota
             
             all_teachers.append({
-                'id': teacher_id,
-                'code': teacher.code,
-                'name': f"{teacher.prenom} {teacher.nom}",
-                'grade': teacher.grade,
-                'email': teacher.email,
+                **identity,
                 'current_surveillances': current_surveillances,
                 'quota': quota,
                 'remaining_surveillances': quota - current_surveillances,
@@ -2481,10 +2379,7 @@ def update_seance_assignments(day, seance, assigned_teacher_ids, force_conflicts
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         seance_key = (day, seance)
         if seance_key not in assignements_data.assignments:
@@ -2493,8 +2388,10 @@ def update_seance_assignments(day, seance, assigned_teacher_ids, force_conflicts
                 'error': f'Seance Day {day}, S{seance} not found'
             }
         
-        # Get current assignments
-        current_assignments = assignements_data.assignments[seance_key].copy()
+        # Get current assignments, as a set since every submitted teacher is checked against it
+        current_assignments = set(assignements_data.assignments[seance_key])
+        # Surveillance totals for every teacher, counted once rather than per submitted teacher
+        surveillance_totals = assignements_data.get_all_teacher_total_surveillances()
         
         # Validate all teacher IDs and check constraints
         changes_made = 0
@@ -2508,29 +2405,29 @@ def update_seance_assignments(day, seance, assigned_teacher_ids, force_conflicts
                 continue
                 
             if not teacher.participe_surveillance:
-                errors.append(f"Teacher {teacher.prenom} {teacher.nom} does not participate in surveillance")
+                errors.append(f"Teacher {teacher.full_name} does not participate in surveillance")
                 continue
                 
             # Check availability - track conflicts but don't block if force_conflicts=True
             if not teacher.is_available(day, seance):
-                conflict_info = f"Teacher {teacher.prenom} {teacher.nom} is not available for this time slot"
+                conflict_info = f"Teacher {teacher.full_name} is not available for this time slot"
                 if not force_conflicts:
                     errors.append(conflict_info)
                     continue
                 else:
                     conflicts.append({
                         'teacher_id': teacher_id,
-                        'teacher_name': f"{teacher.prenom} {teacher.nom}",
+                        'teacher_name': teacher.full_name,
                         'message': conflict_info
                     })
                 
-            current_surveillances = assignements_data.get_teacher_total_surveillances(teacher_id)
-            quota = assignements_data.get_teacher_quota(teacher_id)
-            
             # For teachers being newly assigned, check quota
-            if teacher_id not in current_assignments and current_surveillances >= quota:
-                errors.append(f"Teacher {teacher.prenom} {teacher.nom} has reached their quota ({current_surveillances}/{quota})")
-                continue
+            if teacher_id not in current_assignments:
+                current_surveillances = surveillance_totals[teacher_id]
+                quota = assignements_data.get_teacher_quota(teacher_id)
+                if current_surveillances >= quota:
+                    errors.append(f"Teacher {teacher.full_name} has reached their quota ({current_surveillances}/{quota})")
+                    continue
         
         if errors:
             return {
@@ -2541,7 +2438,7 @@ def update_seance_assignments(day, seance, assigned_teacher_ids, force_conflicts
         # Apply changes: remove all current assignments and add new ones
         assignements_data.assignments[seance_key] = assigned_teacher_ids
         
-        save_current_state()  # Save state after assignment changes
+        schedule_save('assignements_data')  # Save state after assignment changes
         
         result = {
             'success': True,
@@ -2560,6 +2457,32 @@ def update_seance_assignments(day, seance, assigned_teacher_ids, force_conflicts
             'error': str(e)
         }
 
+# Where generated PDFs and ZIPs are written, and the URL Eel serves them under
+REPORTS_DIR = 'web/generated_reports'
+REPORTS_URL = '/generated_reports'
+
+# Report header values used when the imported seances don't specify them
+DEFAULT_SEMESTER = "S1"
+DEFAULT_EXAM_TYPE = "Examen"
+DEFAULT_SESSION = "principale"
+
+# Times shown for an assigned seance that no longer exists in the seances data
+DEFAULT_H_DEBUT = "08:00:00"
+DEFAULT_H_FIN = "12:00:00"
+
+# Set once REPORTS_DIR is known to exist, so report endpoints skip the makedirs call
+_reports_dir_ready = False
+
+def _ensure_reports_dir():
+    """Create the web-accessible directory for generated reports on first use"""
+    global _reports_dir_ready
+    if not _reports_dir_ready:
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        _reports_dir_ready = True
+
+# Last report rendered per (day, seance): (render inputs, output_path, file signature), so an unchanged seance is not re-rendered
+_seance_reports = {}
+
 @eel.expose
 def generate_surveillance_report_for_seance(day, seance, file_name):
     """Generate surveillance report PDF for a specific seance"""
@@ -2567,10 +2490,7 @@ def generate_surveillance_report_for_seance(day, seance, file_name):
     
     try:
         if not assignements_data:
-            return {
-                'success': False,
-                'error': 'Assignments system not initialized'
-            }
+            return ASSIGNMENTS_NOT_INITIALIZED_ERROR
         
         if not enseignants_data:
             return {
@@ -2600,7 +2520,7 @@ def generate_surveillance_report_for_seance(day, seance, file_name):
         for teacher_id in assigned_teacher_ids:
             teacher = enseignants_data.get_enseignant_by_code(teacher_id)
             if teacher:
-                teacher_names.append(f"{teacher.prenom} {teacher.nom}")
+                teacher_names.append(teacher.full_name)
         
         if not teacher_names:
             return {
@@ -2610,29 +2530,55 @@ def generate_surveillance_report_for_seance(day, seance, file_name):
         
         # Get seance information
         date_str = seances_data.dates[day - 1] if day <= len(seances_data.dates) else f"Day {day}"
-        seance_name = f"S{seance}"
         
         # Create output path in web-accessible directory
-        os.makedirs('web/generated_reports', exist_ok=True)
-        output_path = f"web/generated_reports/{file_name}"
-        
-        # Generate the PDF
-        result = create_surveillance_report(
-            enseignants=teacher_names,
-            semester=seances_data.semester or "S1",
-            exam_type=seances_data.exam_type or "Examen",
-            session=seances_data.session or "principale",
-            date=date_str,
-            seance_name=seance_name,
-            output_path=output_path
+        _ensure_reports_dir()
+        output_path = f"{REPORTS_DIR}/{file_name}"
+        
+        report_inputs = (
+            tuple(teacher_names),
+            seances_data.semester or DEFAULT_SEMESTER,
+            seances_data.exam_type or DEFAULT_EXAM_TYPE,
+            seances_data.session or DEFAULT_SESSION,
+            date_str,
+            seance_name(seance)
         )
         
+        cached = _seance_reports.get(seance_key)
+        if cached and cached[0] == report_inputs and _file_signature(cached[1]) == cached[2]:
+            # Same inputs as the last render and its file untouched since: reuse that PDF instead of generating it again
+            if cached[1] != output_path:
+                shutil.copyfile(cached[1], output_path)
+            result = {
+                'status': 'success',
+                'message': f'PDF généré avec succès: {output_path}',
+                'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            }
+        else:
+            enseignants, semester, exam_type, session, date, name = report_inputs
+            
+            # Generate the PDF
+            result = create_surveillance_report(
+                enseignants=list(enseignants),
+                semester=semester,
+                exam_type=exam_type,
+                session=session,
+                date=date,
+                seance_name=name,
+                output_path=output_path
+            )
+            
+            if result.get('status') == 'success':
+                # Another seance rendered earlier to this file name has just been overwritten
+                for key in [key for key, entry in _seance_reports.items() if entry[1] == output_path]:
+                    del _seance_reports[key]
+                _seance_reports[seance_key] = (report_inputs, output_path, _file_signature(output_path))
         
         if result.get('status') == 'success':
             # Return web-accessible path and convert to frontend format
             return {
                 'success': True,
-                'output_path': f"/generated_reports/{file_name}",
+                'output_path': f"{REPORTS_URL}/{file_name}",
                 'message': result.get('message', 'PDF généré avec succès'),
                 'enseignants_count': len(teacher_names),
                 'generated_at': result.get('generated_at')
@@ -2646,12 +2592,41 @@ def generate_surveillance_report_for_seance(day, seance, file_name):
         
     except Exception as e:
         print(f"Exception in generate_surveillance_report_for_seance: {str(e)}")
-        traceback.print_exc()
+        logger.debug("Exception in generate_surveillance_report_for_seance", exc_info=True)
         return {
             'success': False,
             'error': f'Error generating surveillance report: {str(e)}'
         }
 
+# Worker processes for bulk PDF rendering, kept alive between requests so each worker starts
+# and parses the report stylesheets only once
+_render_pool = None
+
+def _render_pdfs(render, jobs):
+    """Call render(**kwargs) for each kwargs in jobs, in worker processes when there are several, returning the results in order"""
+    global _render_pool
+    # With a single CPU the workers would only add process overhead to the same serial work
+    if len(jobs) <= 1 or (os.cpu_count() or 1) <= 1:
+        return [render(**kwargs) for kwargs in jobs]
+    
+    # PDF rendering is CPU-bound, so separate processes render several files at once despite the GIL.
+    # render must live in a module without import side effects (pdf_generation), since workers import it
+    if _render_pool is None:
+        _render_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+    
+    try:
+        futures = [_render_pool.submit(render, **kwargs) for kwargs in jobs]
+        return [future.result() for future in futures]
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool for the next request
+        _render_pool = None
+        raise
+
+def _shutdown_render_pool():
+    """Stop the PDF worker processes"""
+    if _render_pool is not None:
+        _render_pool.shutdown(cancel_futures=True)
+
 @eel.expose
 def generate_all_surveillance_reports(base_name):
     """Generate surveillance reports for all seances with assignments and create a ZIP file"""
@@ -2666,7 +2641,7 @@ def generate_all_surveillance_reports(base_name):
         
         results = []
         generated_count = 0
-        temp_files = []  # Keep track of temporary PDF files
+        pdf_files = []  # (filename, content) of each generated PDF
         
         # Get all assignments
         all_assignments = assignements_data.assignments
@@ -2678,86 +2653,91 @@ def generate_all_surveillance_reports(base_name):
             }
         
         # Create output directory in web-accessible location
-        os.makedirs('web/generated_reports', exist_ok=True)
-        
-        # Create a temporary directory for PDF files
-        temp_dir = tempfile.mkdtemp()
-        
-        try:
-            for (day, seance), teacher_ids in all_assignments.items():
-                if not teacher_ids:  # Skip empty assignments
-                    continue
-                    
-                # Get teacher names
-                teacher_names = []
-                for teacher_id in teacher_ids:
-                    teacher = enseignants_data.get_enseignant_by_code(teacher_id)
-                    if teacher:
-                        teacher_names.append(f"{teacher.prenom} {teacher.nom}")
-                
-                if not teacher_names:
-                    continue
-                
-                # Create filename for this seance
-                date_str = seances_data.dates[day - 1] if day <= len(seances_data.dates) else f"Day{day}"
-                safe_date = date_str.replace('/', '-').replace('\\', '-')
-                filename = f"surveillance_J{day}_S{seance}_{safe_date}.pdf"
-                temp_pdf_path = os.path.join(temp_dir, filename)
-                
-                # Generate the PDF in temporary directory
-                result = create_surveillance_report(
-                    enseignants=teacher_names,
-                    semester=seances_data.semester or "S1",
-                    exam_type=seances_data.exam_type or "Examen",
-                    session=seances_data.session or "principale",
-                    date=date_str,
-                    seance_name=f"S{seance}",
-                    output_path=temp_pdf_path
-                )
-                
-                results.append({
-                    'day': day,
-                    'seance': seance,
-                    'date': date_str,
-                    'filename': filename,
-                    'result': result
-                })
+        _ensure_reports_dir()
+        
+        # Collect everything each report needs here, so the PDFs can be rendered in worker processes and returned in memory
+        reports = []
+        jobs = []
+        # The same for every seance
+        report_header = {
+            'semester': seances_data.semester or DEFAULT_SEMESTER,
+            'exam_type': seances_data.exam_type or DEFAULT_EXAM_TYPE,
+            'session': seances_data.session or DEFAULT_SESSION
+        }
+        # Looked up once rather than on every seance
+        dates = seances_data.dates
+        get_teacher = enseignants_data.get_enseignant_by_code
+        for (day, seance), teacher_ids in all_assignments.items():
+            if not teacher_ids:  # Skip empty assignments
+                continue
                 
-                if result.get('status') == 'success':
-                    generated_count += 1
-                    temp_files.append((temp_pdf_path, filename))
-            
-            if generated_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No PDF reports were successfully generated'
-                }
+            # Get teacher names
+            teacher_names = []
+            for teacher_id in teacher_ids:
+                teacher = get_teacher(teacher_id)
+                if teacher:
+                    teacher_names.append(teacher.full_name)
             
-            # Create ZIP file containing all PDFs
-            zip_filename = f"rapports_surveillance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
-            zip_path = f"web/generated_reports/{zip_filename}"
+            if not teacher_names:
+                continue
             
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for temp_pdf_path, original_filename in temp_files:
-                    if os.path.exists(temp_pdf_path):
-                        zipf.write(temp_pdf_path, original_filename)
+            # Create filename for this seance
+            date_str = dates[day - 1] if day <= len(dates) else f"Day{day}"
+            safe_date = date_str.replace('/', '-').replace('\\', '-')
+            filename = f"surveillance_J{day}_S{seance}_{safe_date}.pdf"
+            
+            reports.append((day, seance, date_str, filename))
+            jobs.append({
+                'enseignants': teacher_names,
+                **report_header,
+                'date': date_str,
+                'seance_name': seance_name(seance)
+            })
+        
+        # Generate the PDFs
+        for (day, seance, date_str, filename), result in zip(reports, _render_pdfs(create_surveillance_report, jobs)):
+            # Only the outcome is reported per seance; the content goes into the ZIP, not into the response
+            ok = result.get('status') == 'success'
+            row = {
+                'day': day,
+                'seance': seance,
+                'date': date_str,
+                'filename': filename,
+                'ok': ok
+            }
             
+            if ok:
+                generated_count += 1
+                pdf_files.append((filename, result['pdf_bytes']))
+            else:
+                row['error'] = result.get('message')
+            results.append(row)
+        
+        if generated_count == 0:
             return {
-                'success': True,
-                'message': f'Generated {generated_count} surveillance reports in ZIP file',
-                'generated_count': generated_count,
-                'total_attempted': len(results),
-                'results': results,
-                'zip_download': {
-                    'url': f"/generated_reports/{zip_filename}",
-                    'filename': zip_filename
-                }
+                'success': False,
+                'error': 'No PDF reports were successfully generated'
             }
-            
-        finally:
-            # Clean up temporary files
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        # Create ZIP file containing all PDFs, stored as is since PDF streams are already compressed
+        zip_filename = f"rapports_surveillance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        zip_path = f"{REPORTS_DIR}/{zip_filename}"
+        
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
+            for filename, pdf_bytes in pdf_files:
+                zipf.writestr(filename, pdf_bytes)
+        
+        return {
+            'success': True,
+            'message': f'Generated {generated_count} surveillance reports in ZIP file',
+            'generated_count': generated_count,
+            'total_attempted': len(results),
+            'results': results,
+            'zip_download': {
+                'url': f"{REPORTS_URL}/{zip_filename}",
+                'filename': zip_filename
+            }
+        }
         
     except Exception as e:
         return {
@@ -2765,6 +2745,45 @@ def generate_all_surveillance_reports(base_name):
             'error': f'Error generating surveillance reports: {str(e)}'
         }
 
+def _seance_timings():
+    """(date, h_debut, h_fin) for every (day, seance), both 1-based, reused until the seances change. Callers must not modify it"""
+    def build():
+        timings = {}
+        for day, date in enumerate(seances_data.dates, 1):
+            for seance, seance_obj in enumerate(seances_data.date_seances.get(date, ()), 1):
+                timings[(day, seance)] = (date, seance_obj.h_debut, seance_obj.h_fin)
+        return timings
+    
+    return cached_for_parts('seance_timings', ('seances_data',), build)
+
+def _seances_by_teacher():
+    """Map of teacher code to the (day, seance) keys they are assigned to, reused until the assignments change. Callers must not modify it"""
+    def build():
+        # A single pass over the assignments instead of a membership scan of every seance per teacher
+        seances_by_teacher = defaultdict(list)
+        for seance_key, teacher_ids in assignements_data.assignments.items():
+            for teacher_id in teacher_ids:
+                seances_by_teacher[teacher_id].append(seance_key)
+        return seances_by_teacher
+    
+    return cached_for_parts('seances_by_teacher', ('assignements_data',), build)
+
+def _schedule_sort_key(entry):
+    """Chronological sort key for a (date, h_debut, h_fin) schedule entry; entries without a real date go last"""
+    date_str, h_debut, _ = entry
+    try:
+        return (0, seances_data.get_date_key(date_str), h_debut)
+    except ValueError:
+        return (1, datetime.min, h_debut)
+
+def _seance_timing(seance_timings, day, seance):
+    """Schedule entry (date, h_debut, h_fin) for an assigned seance, with default times for one that no longer exists"""
+    timing = seance_timings.get((day, seance))
+    if timing is None:
+        date_str = seances_data.dates[day - 1] if day <= len(seances_data.dates) else f"Day {day}"
+        timing = (date_str, DEFAULT_H_DEBUT, DEFAULT_H_FIN)
+    return timing
+
 @eel.expose
 def generate_teacher_schedule_report(teacher_email, file_name):
     """Generate individual teacher schedule report"""
@@ -2787,31 +2806,14 @@ def generate_teacher_schedule_report(teacher_email, file_name):
                 'error': 'Teacher not found'
             }
         
-        teacher_name = f"{teacher.prenom} {teacher.nom}"
+        teacher_name = teacher.full_name
         
         # Get teacher's assignments
-        schedule = []
-        all_assignments = assignements_data.assignments
-        
-        for (day, seance), teacher_ids in all_assignments.items():
-            if teacher.code in teacher_ids:
-                date_str = seances_data.dates[day - 1] if day <= len(seances_data.dates) else f"Day {day}"
-                
-                # Get seance timing from seances data
-                if day <= len(seances_data.dates):
-                    date_key = seances_data.dates[day - 1]
-                    if date_key in seances_data.date_seances and seance - 1 < len(seances_data.date_seances[date_key]):
-                        seance_obj = seances_data.date_seances[date_key][seance - 1]
-                        h_debut = seance_obj.h_debut
-                        h_fin = seance_obj.h_fin
-                    else:
-                        h_debut = "08:00:00"
-                        h_fin = "12:00:00"
-                else:
-                    h_debut = "08:00:00"
-                    h_fin = "12:00:00"
-                
-                schedule.append((date_str, h_debut, h_fin))
+        seance_timings = _seance_timings()
+        schedule = [
+            _seance_timing(seance_timings, day, seance)
+            for day, seance in _seances_by_teacher().get(teacher.code, ())
+        ]
         
         if not schedule:
             return {
@@ -2819,12 +2821,12 @@ def generate_teacher_schedule_report(teacher_email, file_name):
                 'error': f'No assignments found for teacher {teacher_name}'
             }
         
-        # Sort schedule by date
-        schedule.sort(key=lambda x: x[0])
+        # Sort schedule by date (DD/MM/YYYY strings don't sort chronologically) and start time
+        schedule.sort(key=_schedule_sort_key)
         
         # Create output path in web-accessible directory
-        os.makedirs('web/generated_reports', exist_ok=True)
-        output_path = f"web/generated_reports/{file_name}"
+        _ensure_reports_dir()
+        output_path = f"{REPORTS_DIR}/{file_name}"
         
         # Generate the PDF
         result = create_enseignant_emploi(
@@ -2837,7 +2839,7 @@ def generate_teacher_schedule_report(teacher_email, file_name):
             # Return web-accessible path and convert to frontend format
             return {
                 'success': True,
-                'output_path': f"/generated_reports/{file_name}",
+                'output_path': f"{REPORTS_URL}/{file_name}",
                 'message': f'Emploi du temps généré avec succès pour {teacher_name}',
                 'teacher_name': teacher_name,
                 'schedule_count': len(schedule),
@@ -2852,12 +2854,22 @@ def generate_teacher_schedule_report(teacher_email, file_name):
         
     except Exception as e:
         print(f"Exception in generate_teacher_schedule_report: {str(e)}")
-        traceback.print_exc()
+        logger.debug("Exception in generate_teacher_schedule_report", exc_info=True)
         return {
             'success': False,
             'error': f'Error generating teacher schedule: {str(e)}'
         }
 
+class _SafeNameTable(dict):
+    """str.translate table for file names: spaces and slashes become underscores, other special characters are removed"""
+    def __missing__(self, codepoint):
+        # Filled in per character on first use, as names can contain any letter
+        char = chr(codepoint)
+        self[codepoint] = codepoint if char.isalnum() or char in '_-' else None
+        return self[codepoint]
+
+_SAFE_NAME_TABLE = _SafeNameTable({ord(c): '_' for c in ' /\\'})
+
 @eel.expose
 def generate_all_teacher_schedules():
     """Generate all teacher schedules and package them in a ZIP file"""
@@ -2872,127 +2884,103 @@ def generate_all_teacher_schedules():
         
         results = []
         generated_count = 0
-        temp_files = []  # Keep track of temporary PDF files
+        pdf_files = []  # (filename, content) of each generated PDF
         
-        # Get all assignments
-        all_assignments = assignements_data.assignments
+        # Seances of every teacher with assignments; seances with no teachers leave no entry
+        seances_by_teacher = _seances_by_teacher()
         
-        if not all_assignments:
+        if not seances_by_teacher:
             return {
                 'success': False,
                 'error': 'No assignments found'
             }
         
         # Create output directory in web-accessible location
-        os.makedirs('web/generated_reports', exist_ok=True)
+        _ensure_reports_dir()
         
-        # Create a temporary directory for PDF files
-        temp_dir = tempfile.mkdtemp()
+        # Collect everything each schedule needs here, so the PDFs can be rendered in worker processes and returned in memory
+        emplois = []
+        jobs = []
         
-        try:
-            # Get all teachers who have assignments
-            teachers_with_assignments = set()
-            for teacher_ids in all_assignments.values():
-                teachers_with_assignments.update(teacher_ids)
+        seance_timings = _seance_timings()
+        # Looked up once rather than on every teacher
+        get_teacher = enseignants_data.get_enseignant_by_code
+        
+        for teacher_code, seance_keys in seances_by_teacher.items():
+            # Get teacher by code
+            teacher = get_teacher(teacher_code)
+            if not teacher:
+                continue
             
-            for teacher_code in teachers_with_assignments:
-                # Get teacher by code
-                teacher = enseignants_data.get_enseignant_by_code(teacher_code)
-                if not teacher:
-                    continue
-                
-                teacher_name = f"{teacher.prenom} {teacher.nom}"
-                
-                # Get teacher's assignments
-                schedule = []
-                
-                for (day, seance), teacher_ids in all_assignments.items():
-                    if teacher.code in teacher_ids:
-                        date_str = seances_data.dates[day - 1] if day <= len(seances_data.dates) else f"Day {day}"
-                        
-                        # Get seance timing from seances data
-                        if day <= len(seances_data.dates):
-                            date_key = seances_data.dates[day - 1]
-                            if date_key in seances_data.date_seances and seance - 1 < len(seances_data.date_seances[date_key]):
-                                seance_obj = seances_data.date_seances[date_key][seance - 1]
-                                h_debut = seance_obj.h_debut
-                                h_fin = seance_obj.h_fin
-                            else:
-                                h_debut = "08:00:00"
-                                h_fin = "12:00:00"
-                        else:
-                            h_debut = "08:00:00"
-                            h_fin = "12:00:00"
-                        
-                        schedule.append((date_str, h_debut, h_fin))
-                
-                if not schedule:
-                    continue  # Skip teachers with no assignments
-                
-                # Sort schedule by date
-                schedule.sort(key=lambda x: x[0])
-                
-                # Create filename for this teacher
-                safe_name = f"{teacher.prenom}_{teacher.nom}".replace(' ', '_').replace('/', '_').replace('\\', '_')
-                # Remove special characters
-                safe_name = ''.join(c for c in safe_name if c.isalnum() or c in ['_', '-'])
-                filename = f"emploi_{safe_name}.pdf"
-                temp_pdf_path = os.path.join(temp_dir, filename)
-                
-                # Generate the PDF in temporary directory
-                result = create_enseignant_emploi(
-                    enseignant_name=teacher_name,
-                    schedule=schedule,
-                    output_path=temp_pdf_path
-                )
-                
-                results.append({
-                    'teacher_name': teacher_name,
-                    'teacher_code': teacher.code,
-                    'filename': filename,
-                    'schedule_count': len(schedule),
-                    'result': result
-                })
-                
-                if result.get('status') == 'success':
-                    generated_count += 1
-                    temp_files.append((temp_pdf_path, filename))
+            teacher_name = teacher.full_name
             
-            if generated_count == 0:
-                return {
-                    'success': False,
-                    'error': 'No teacher schedules were successfully generated'
-                }
+            # Get teacher's assignments
+            schedule = [_seance_timing(seance_timings, day, seance) for day, seance in seance_keys]
             
-            # Create ZIP file containing all PDFs
-            zip_filename = f"emplois_temps_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
-            zip_path = f"web/generated_reports/{zip_filename}"
+            if not schedule:
+                continue  # Skip teachers with no assignments
             
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for temp_pdf_path, original_filename in temp_files:
-                    if os.path.exists(temp_pdf_path):
-                        zipf.write(temp_pdf_path, original_filename)
+            # Sort schedule by date (DD/MM/YYYY strings don't sort chronologically) and start time
+            schedule.sort(key=_schedule_sort_key)
             
-            return {
-                'success': True,
-                'message': f'Generated {generated_count} teacher schedules in ZIP file',
-                'generated_count': generated_count,
-                'total_attempted': len(results),
-                'results': results,
-                'zip_download': {
-                    'url': f"/generated_reports/{zip_filename}",
-                    'filename': zip_filename
-                }
+            # Create filename for this teacher
+            safe_name = f"{teacher.prenom}_{teacher.nom}".translate(_SAFE_NAME_TABLE)
+            filename = f"emploi_{safe_name}.pdf"
+            
+            emplois.append((teacher_name, teacher.code, filename, len(schedule)))
+            jobs.append({
+                'enseignant_name': teacher_name,
+                'schedule': schedule
+            })
+        
+        # Generate the PDFs
+        for (teacher_name, teacher_code, filename, schedule_count), result in zip(emplois, _render_pdfs(create_enseignant_emploi, jobs)):
+            # Only the outcome is reported per teacher; the content goes into the ZIP, not into the response
+            ok = result.get('status') == 'success'
+            row = {
+                'teacher_name': teacher_name,
+                'teacher_code': teacher_code,
+                'filename': filename,
+                'schedule_count': schedule_count,
+                'ok': ok
             }
             
-        finally:
-            # Clean up temporary files
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            if ok:
+                generated_count += 1
+                pdf_files.append((filename, result['pdf_bytes']))
+            else:
+                row['error'] = result.get('message')
+            results.append(row)
+        
+        if generated_count == 0:
+            return {
+                'success': False,
+                'error': 'No teacher schedules were successfully generated'
+            }
+        
+        # Create ZIP file containing all PDFs, stored as is since PDF streams are already compressed
+        zip_filename = f"emplois_temps_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        zip_path = f"{REPORTS_DIR}/{zip_filename}"
+        
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
+            for filename, pdf_bytes in pdf_files:
+                zipf.writestr(filename, pdf_bytes)
+        
+        return {
+            'success': True,
+            'message': f'Generated {generated_count} teacher schedules in ZIP file',
+            'generated_count': generated_count,
+            'total_attempted': len(results),
+            'results': results,
+            'zip_download': {
+                'url': f"{REPORTS_URL}/{zip_filename}",
+                'filename': zip_filename
+            }
+        }
         
     except Exception as e:
         print(f"Exception in generate_all_teacher_schedules: {str(e)}")
-        traceback.print_exc()
+        logger.debug("Exception in generate_all_teacher_schedules", exc_info=True)
         return {
             'success': False,
             'error': f'Error generating teacher schedules: {str(e)}'
@@ -3000,7 +2988,20 @@ def generate_all_teacher_schedules():
 
 def start_app():
     """Start the Eel application"""
+    # Done here rather than at import time, since PDF worker processes started with spawn import this module
+    eel.init('web')
+    if orjson is not None:
+        # Eel serializes every return value and JS call through _safe_json
+        eel._safe_json = _orjson_safe_json
+    
+    threading.Thread(target=_background_saver, name='state-saver', daemon=True).start()
+    
+    # The saver thread is a daemon, so write whatever it has not saved yet when the interpreter exits
+    atexit.register(flush_pending_save)
+    atexit.register(_shutdown_render_pool)
+    
     try:
+        logging.basicConfig(level=logging.INFO)
         print("Starting ISI Exams Management Application...")
         
         # First, try to start the server without opening a browser
@@ -3009,6 +3010,9 @@ def start_app():
         
         print(f"Starting server on port {port}...")
         
+        # Parse the report stylesheets in the background so the first PDF doesn't wait for it
+        threading.Thread(target=prewarm_pdf_generation, name='pdf-prewarm', daemon=True).start()
+        
         # Try different approaches
         eel.start('seances.html', size=(1200, 800), port=port, mode='default')
                 
@@ -3017,6 +3021,9 @@ def start_app():
     except Exception as e:
         print(f"Error starting application: {e}")
         print(f"Please manually open your browser and go to: http://localhost:8080/seances.html")
+    finally:
+        # Write any edits still waiting for the background saver
+        flush_pending_save()
 
 if __name__ == '__main__':
     start_app()
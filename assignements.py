@@ -1,5 +1,8 @@
+import os
+import heapq
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
+from collections import Counter
 from enseignants import Enseignants, Enseignant
 from seances import Seances, Seance
 from configuration import Configuration
@@ -21,11 +24,22 @@ class Assignements:
     # Requirements: (day, seance) -> number of teachers needed
     requirements: Dict[Tuple[int, int], int] = field(default_factory=dict)
     
+    # Parallel CP-SAT search workers for auto_assign_teachers; None uses one per CPU core, up to 16
+    num_search_workers: Optional[int] = None
+    
     def __post_init__(self):
         """Initialize the assignment structure"""
         self._initialize_requirements()
         self._initialize_assignments()
     
+    def __getstate__(self):
+        """Pickle only the assignment tables; enseignants, seances and configuration are saved separately and relinked on load"""
+        state = self.__dict__.copy()
+        state['enseignants'] = None
+        state['seances'] = None
+        state['configuration'] = None
+        return state
+    
     def _initialize_requirements(self):
         """Calculate and store teacher requirements for each seance using F = teachers_per_room + surplus_teacher_per_room"""
         import math
@@ -92,7 +106,7 @@ class Assignements:
         return {
             "success": True, 
             "is_conflict": not is_available,
-            "teacher_name": f"{teacher.prenom} {teacher.nom}"
+            "teacher_name": teacher.full_name
         }
     
     def remove_teacher_from_seance(self, day: int, seance: int, teacher_id: int) -> bool:
@@ -126,6 +140,13 @@ class Assignements:
                 total_surveillances += 1
         return total_surveillances
     
+    def get_all_teacher_total_surveillances(self) -> Counter:
+        """Count assigned surveillances for every teacher in a single pass over the assignments"""
+        totals = Counter()
+        for assignments in self.assignments.values():
+            totals.update(set(assignments))
+        return totals
+    
     def get_teacher_quota(self, teacher_id: int) -> int:
         """Get the maximum surveillances a teacher can be assigned based on their grade"""
         teacher = self.enseignants.get_enseignant_by_code(teacher_id)
@@ -137,17 +158,18 @@ class Assignements:
     def get_all_conflicts(self) -> List[Dict[str, any]]:
         """Get all assignment conflicts (teachers assigned to unavailable seances) - Dynamic check"""
         conflicts_list = []
+        get_teacher = self.enseignants.get_enseignant_by_code
         
         # Dynamically check all assignments for conflicts
         for (day, seance), teacher_ids in self.assignments.items():
             for teacher_id in teacher_ids:
-                teacher = self.enseignants.get_enseignant_by_code(teacher_id)
+                teacher = get_teacher(teacher_id)
                 if teacher and not teacher.is_available(day, seance):
                     conflicts_list.append({
                         'day': day,
                         'seance': seance,
                         'teacher_id': teacher_id,
-                        'teacher_name': f"{teacher.prenom} {teacher.nom}",
+                        'teacher_name': teacher.full_name,
                         'teacher_email': teacher.email,
                         'grade': teacher.grade
                     })
@@ -239,6 +261,9 @@ class Assignements:
                 remaining_needed = max(0, max_teachers - current_assigned)
                 N += remaining_needed
         
+        # Current surveillances of every teacher, counted once for the grade totals and the quota constraints
+        surveillance_totals = self.get_all_teacher_total_surveillances()
+        
         # Group teachers by grade and calculate parameters
         grade_info = {}  # grade -> {'ni': count, 'Qi': quota, 'teachers': [teacher_ids], 'current_total': assignments}
         
@@ -256,7 +281,7 @@ class Assignements:
             
             grade_info[grade]['ni'] += 1
             grade_info[grade]['teachers'].append(teacher_id)
-            grade_info[grade]['current_total'] += self.get_teacher_total_surveillances(teacher_id)
+            grade_info[grade]['current_total'] += surveillance_totals[teacher_id]
         
         # PHASE 1: Calculate optimal Si per grade using greedy algorithm
         grade_assignments = {}  # grade -> Si (assignments per teacher in this grade)
@@ -268,82 +293,68 @@ class Assignements:
         remaining = N
         
         # Greedy assignment: repeatedly assign to grade with lowest utilization ratio
-        while remaining > 0:
-            # Find grade with lowest current ratio Ai/Qi
-            best_grade = None
-            best_ratio = float('inf')
+        # Grades are kept in a min-heap on (ratio Ai/Qi, position), the position breaking ties in favour of the first grade listed
+        def total_per_teacher(grade):
+            info = grade_info[grade]
+            # Current assignments per teacher in this grade plus planned assignments from our algorithm
+            return info['current_total'] / info['ni'] + grade_assignments[grade]
+        
+        # Only consider grades with positive quota
+        heap = [(total_per_teacher(grade) / info['Qi'], position, grade)
+                for position, (grade, info) in enumerate(grade_info.items()) if info['Qi'] > 0]
+        heapq.heapify(heap)
+        
+        while remaining > 0 and heap:
+            _, position, grade = heapq.heappop(heap)
             
-            for grade, info in grade_info.items():
-                if info['Qi'] > 0:  # Only consider grades with positive quota
-                    # Calculate current assignments per teacher in this grade
-                    current_per_teacher = (info['current_total'] / info['ni']) if info['ni'] > 0 else 0
-                    # Add planned assignments from our algorithm
-                    planned_per_teacher = grade_assignments[grade]
-                    total_per_teacher = current_per_teacher + planned_per_teacher
-                    
-                    ratio = total_per_teacher / info['Qi']
-                    
-                    # Only assign if we haven't exceeded quota
-                    if total_per_teacher < info['Qi'] and ratio < best_ratio:
-                        best_ratio = ratio
-                        best_grade = grade
-            
-            if best_grade is None:
-                # No grade can accept more assignments - break to avoid infinite loop
-                break
+            # Only assign if we haven't exceeded quota; a grade at its quota stays there, so it is dropped
+            if total_per_teacher(grade) >= grade_info[grade]['Qi']:
+                continue
             
             # Assign one more assignment to each teacher in the best grade
-            grade_assignments[best_grade] += 1
-            remaining -= grade_info[best_grade]['ni']
+            grade_assignments[grade] += 1
+            remaining -= grade_info[grade]['ni']
+            heapq.heappush(heap, (total_per_teacher(grade) / grade_info[grade]['Qi'], position, grade))
         
         # PHASE 2: Use OR-Tools to assign specific teachers based on calculated Si values
         model = cp_model.CpModel()
         
+        # Teachers already assigned to each seance, as sets for the membership checks while building the model
+        already_assigned = {seance_key: set(self.assignments[seance_key]) for seance_key in seance_keys}
+        
         # Decision variables: teacher_assigned[teacher_id][seance_key] = 1 if assigned
+        # Only created for the seances a teacher can still be given, instead of creating every pair and fixing the rest to 0
         teacher_assigned = {}
-        for teacher_id in teacher_ids:
-            teacher_assigned[teacher_id] = {}
-            for seance_key in seance_keys:
-                day, seance = seance_key
-                teacher_assigned[teacher_id][seance_key] = model.NewBoolVar(f'teacher_{teacher_id}_day_{day}_seance_{seance}')
+        # New assignments each teacher must get, and teachers still missing per seance, for the warm start below
+        assignment_targets = {}
+        seance_demand = {}
         
         # HARD CONSTRAINT 1: Teachers must be assigned exactly Si assignments (based on their grade)
-        for teacher_id in teacher_ids:
-            teacher = self.enseignants.get_enseignant_by_code(teacher_id)
-            if not teacher:
-                continue
-            
+        for teacher in participating_teachers:
+            teacher_id = teacher.code
             grade = teacher.grade
             target_assignments = grade_assignments.get(grade, 0)
-            current_assigned = self.get_teacher_total_surveillances(teacher_id)
+            current_assigned = surveillance_totals[teacher_id]
             
             # Calculate how many new assignments this teacher should get
             total_target = current_assigned + target_assignments
-            quota = self.get_teacher_quota(teacher_id)
+            quota = grade_info[grade]['Qi']
             
             # Don't exceed quota, but try to reach target
             new_assignments_needed = min(target_assignments, max(0, quota - current_assigned))
             
+            teacher_assigned[teacher_id] = {}
+            assignment_targets[teacher_id] = new_assignments_needed
             if new_assignments_needed > 0:
-                # Get all possible new assignments for this teacher
-                possible_assignments = []
+                # HARD CONSTRAINT 2: Teachers cannot be assigned to slots where already assigned
                 for seance_key in seance_keys:
-                    if teacher_id not in self.assignments[seance_key]:
-                        possible_assignments.append(teacher_assigned[teacher_id][seance_key])
+                    if teacher_id not in already_assigned[seance_key]:
+                        day, seance = seance_key
+                        teacher_assigned[teacher_id][seance_key] = model.NewBoolVar(f'teacher_{teacher_id}_day_{day}_seance_{seance}')
                 
+                possible_assignments = list(teacher_assigned[teacher_id].values())
                 if possible_assignments:
                     model.Add(sum(possible_assignments) == new_assignments_needed)
-            else:
-                # No new assignments needed/possible
-                for seance_key in seance_keys:
-                    if teacher_id not in self.assignments[seance_key]:
-                        model.Add(teacher_assigned[teacher_id][seance_key] == 0)
-        
-        # HARD CONSTRAINT 2: Teachers cannot be assigned to slots where already assigned
-        for teacher_id in teacher_ids:
-            for seance_key in seance_keys:
-                if teacher_id in self.assignments[seance_key]:
-                    model.Add(teacher_assigned[teacher_id][seance_key] == 0)
         
         # HARD CONSTRAINT 3: Seances must have at least ceiling(Rj * F) teachers
         for seance_key in seance_keys:
@@ -357,15 +368,21 @@ class Assignements:
                 
                 current_assigned = len(self.assignments[seance_key])
                 remaining_needed = max(0, min_teachers - current_assigned)
+                seance_demand[seance_key] = remaining_needed
                 
                 if remaining_needed > 0:
-                    new_assignments = [teacher_assigned[teacher_id][seance_key] for teacher_id in teacher_ids 
-                                     if teacher_id not in self.assignments[seance_key]]
+                    new_assignments = [candidates[seance_key] for candidates in teacher_assigned.values()
+                                     if seance_key in candidates]
                     if new_assignments:
                         model.Add(sum(new_assignments) >= remaining_needed)
+                    elif any(teacher_id not in already_assigned[seance_key] for teacher_id in teacher_ids):
+                        # Teachers are left for this seance but none can take another one: unsatisfiable
+                        model.AddBoolOr([])
         
         # OBJECTIVE FUNCTION with prioritized weights
-        objective_terms = []
+        # Combined weight of each (teacher_id, seance_key) assignment, also ranking the seances of the warm start
+        assignment_weights = Counter()
+        consecutive_vars = []
         
         # HIGH PRIORITY: Responsible teachers bonus
         responsible_mapping = self.seances.get_day_seance_teachers_mapping()
@@ -376,62 +393,82 @@ class Assignements:
             
             if seance_key in seance_keys:
                 for teacher_id in responsible_teachers:
-                    if teacher_id in teacher_ids and teacher_id not in self.assignments[seance_key]:
-                        objective_terms.append(teacher_assigned[teacher_id][seance_key] * WEIGHT_RESPONSIBLE_TEACHERS)
+                    if seance_key in teacher_assigned.get(teacher_id, ()):
+                        assignment_weights[teacher_id, seance_key] += WEIGHT_RESPONSIBLE_TEACHERS
         
         # MEDIUM PRIORITY: Availability preference
-        for teacher_id in teacher_ids:
-            teacher = self.enseignants.get_enseignant_by_code(teacher_id)
-            if not teacher:
-                continue
+        for teacher in participating_teachers:
+            teacher_id = teacher.code
+            
+            # Look up the teacher's unavailable seances once instead of once per seance
+            unavailable_keys = teacher.get_unavailable_slots_among(seance_keys)
             
-            for seance_key in seance_keys:
-                day, seance = seance_key
-                if teacher_id not in self.assignments[seance_key]:
-                    if teacher.is_available(day, seance):
-                        # Bonus for available slots
-                        objective_terms.append(teacher_assigned[teacher_id][seance_key] * WEIGHT_AVAILABILITY_BONUS)
-                    else:
-                        # Penalty for unavailable slots (but still allow if needed)
-                        objective_terms.append(teacher_assigned[teacher_id][seance_key] * WEIGHT_AVAILABILITY_PENALTY)
+            for seance_key in teacher_assigned[teacher_id]:
+                if seance_key not in unavailable_keys:
+                    # Bonus for available slots
+                    assignment_weights[teacher_id, seance_key] += WEIGHT_AVAILABILITY_BONUS
+                else:
+                    # Penalty for unavailable slots (but still allow if needed)
+                    assignment_weights[teacher_id, seance_key] += WEIGHT_AVAILABILITY_PENALTY
         
         # LOW PRIORITY: Consecutive seances bonus
-        for teacher_id in teacher_ids:
-            teacher = self.enseignants.get_enseignant_by_code(teacher_id)
-            if not teacher:
-                continue
+        # The consecutive (day, seance) pairs are the same for every teacher, so list them once
+        seances_by_day = {}
+        for day, seance in seance_keys:
+            seances_by_day.setdefault(day, []).append(seance)
+        
+        consecutive_pairs = []
+        for day in range(1, len(self.seances.dates) + 1):
+            # Get seances for this day in order
+            day_seances = sorted(seances_by_day.get(day, ()))
+            for seance1, seance2 in zip(day_seances, day_seances[1:]):
+                consecutive_pairs.append((day, seance1, seance2))
+        
+        for teacher_id, candidates in teacher_assigned.items():
+            for day, seance1, seance2 in consecutive_pairs:
+                seance_key1 = (day, seance1)
+                seance_key2 = (day, seance2)
                 
-            for day in range(1, len(self.seances.dates) + 1):
-                # Get seances for this day in order
-                day_seances = [s for d, s in seance_keys if d == day]
-                day_seances.sort()
-                
-                # Check consecutive pairs
-                for i in range(len(day_seances) - 1):
-                    seance1 = day_seances[i]
-                    seance2 = day_seances[i + 1]
-                    seance_key1 = (day, seance1)
-                    seance_key2 = (day, seance2)
+                if seance_key1 in candidates and seance_key2 in candidates:
+                    
+                    # Create consecutive variable
+                    consecutive_var = model.NewBoolVar(f'consecutive_{teacher_id}_day_{day}_seance_{seance1}_{seance2}')
+                    assigned1 = candidates[seance_key1]
+                    assigned2 = candidates[seance_key2]
+                    # consecutive_var == assigned1 AND assigned2, as boolean clauses CP-SAT propagates natively
+                    model.AddBoolAnd([assigned1, assigned2]).OnlyEnforceIf(consecutive_var)
+                    model.AddBoolOr([assigned1.Not(), assigned2.Not(), consecutive_var])
                     
-                    if (seance_key1 in seance_keys and seance_key2 in seance_keys and
-                        teacher_id not in self.assignments[seance_key1] and 
-                        teacher_id not in self.assignments[seance_key2]):
-                        
-                        # Create consecutive variable
-                        consecutive_var = model.NewBoolVar(f'consecutive_{teacher_id}_day_{day}_seance_{seance1}_{seance2}')
-                        model.Add(consecutive_var <= teacher_assigned[teacher_id][seance_key1])
-                        model.Add(consecutive_var <= teacher_assigned[teacher_id][seance_key2])
-                        model.Add(consecutive_var >= teacher_assigned[teacher_id][seance_key1] + teacher_assigned[teacher_id][seance_key2] - 1)
-                        
-                        objective_terms.append(consecutive_var * WEIGHT_CONSECUTIVE)
-        
-        # Set objective to maximize
-        if objective_terms:
-            model.Maximize(sum(objective_terms))
+                    consecutive_vars.append(consecutive_var)
+        
+        # Set objective to maximize, as one weighted sum with a single term per variable
+        objective_vars = []
+        objective_weights = []
+        for (teacher_id, seance_key), weight in assignment_weights.items():
+            if weight:
+                objective_vars.append(teacher_assigned[teacher_id][seance_key])
+                objective_weights.append(weight)
+        objective_vars.extend(consecutive_vars)
+        objective_weights.extend([WEIGHT_CONSECUTIVE] * len(consecutive_vars))
+        if objective_vars:
+            model.Maximize(cp_model.LinearExpr.WeightedSum(objective_vars, objective_weights))
+        
+        # WARM START: hint a greedy plan so the solver starts from a good incumbent instead of searching for one.
+        # Each teacher takes exactly its target count, preferring its best-weighted seances, then those still missing the most teachers
+        hint_demand = dict(seance_demand)
+        for teacher_id, candidates in teacher_assigned.items():
+            ranked = sorted(candidates, key=lambda seance_key: (-assignment_weights[teacher_id, seance_key], -hint_demand.get(seance_key, 0)))
+            chosen = set(ranked[:assignment_targets[teacher_id]])
+            for seance_key, assigned in candidates.items():
+                model.AddHint(assigned, seance_key in chosen)
+            for seance_key in chosen:
+                hint_demand[seance_key] = hint_demand.get(seance_key, 0) - 1
         
         # Solve the model
         solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = TIMEOUT_SECONDS
+        solver.parameters.num_search_workers = self.num_search_workers or min(16, os.cpu_count() or 1)
+        solver.parameters.log_search_progress = False
         status = solver.Solve(model)
         
         # Prepare results
@@ -448,10 +485,9 @@ class Assignements:
         if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             # Apply the solution
             assignments_made = 0
-            for teacher_id in teacher_ids:
-                for seance_key in seance_keys:
-                    if (teacher_id not in self.assignments[seance_key] and 
-                        solver.Value(teacher_assigned[teacher_id][seance_key]) == 1):
+            for teacher_id, candidates in teacher_assigned.items():
+                for seance_key, assigned in candidates.items():
+                    if solver.Value(assigned) == 1:
                         day, seance = seance_key
                         # Force assignment even if unavailable (solver already considered penalties)
                         assignment_result = self.assign_teacher_to_seance(day, seance, teacher_id, force_unavailable=True)
@@ -533,23 +569,28 @@ class Assignements:
             'seance_details': []
         }
         
+        get_teacher = self.enseignants.get_enseignant_by_code
+        
         # Analyze seance satisfaction
         for seance_key, required in self.requirements.items():
-            assigned = len(self.assignments[seance_key])
+            day, seance = seance_key
+            teacher_ids = self.assignments[seance_key]
+            assigned = len(teacher_ids)
             
-            # Check for conflicts in this seance
+            # Check for conflicts in this seance (same check as is_assignment_conflict, the teachers being known to be assigned)
             has_conflicts = False
-            for teacher_id in self.assignments[seance_key]:
-                if self.is_assignment_conflict(seance_key[0], seance_key[1], teacher_id):
+            for teacher_id in teacher_ids:
+                teacher = get_teacher(teacher_id)
+                if teacher and not teacher.is_available(day, seance):
                     has_conflicts = True
                     break
             
             seance_detail = {
-                'day': seance_key[0],
-                'seance': seance_key[1],
+                'day': day,
+                'seance': seance,
                 'required': required,
                 'assigned': assigned,
-                'teachers': self.assignments[seance_key].copy(),
+                'teachers': teacher_ids.copy(),
                 'is_complete': assigned >= required,
                 'is_over_assigned': assigned > required,
                 'has_conflicts': has_conflicts
@@ -564,16 +605,18 @@ class Assignements:
                 summary['unsatisfied_seances'] += 1
         
         # Analyze teacher utilization
+        surveillance_totals = self.get_all_teacher_total_surveillances()
         for teacher in self.enseignants.get_enseignants_participating_surveillance():
             if teacher.code is None:
                 continue
             
             teacher_id = teacher.code
-            assigned_surveillances = self.get_teacher_total_surveillances(teacher_id)
-            quota = self.get_teacher_quota(teacher_id)
+            assigned_surveillances = surveillance_totals[teacher_id]
+            # Same as get_teacher_quota, without looking the teacher up again
+            quota = self.configuration.get_grade_hours(teacher.grade)
             
             summary['teacher_utilization'][teacher_id] = {
-                'name': f"{teacher.prenom} {teacher.nom}",
+                'name': teacher.full_name,
                 'grade': teacher.grade,
                 'assigned_surveillances': assigned_surveillances,
                 'quota': quota,
@@ -598,6 +641,7 @@ class Assignements:
         
         # Show seance assignments
         result += "Seance Assignments:\n"
+        get_teacher = self.enseignants.get_enseignant_by_code
         for detail in summary['seance_details']:
             if detail['assigned'] >= detail['required']:
                 status = "✓"
@@ -609,9 +653,9 @@ class Assignements:
             if detail['teachers']:
                 teacher_names = []
                 for teacher_id in detail['teachers']:
-                    teacher = self.enseignants.get_enseignant_by_code(teacher_id)
+                    teacher = get_teacher(teacher_id)
                     if teacher:
-                        teacher_names.append(f"{teacher.prenom} {teacher.nom}")
+                        teacher_names.append(teacher.full_name)
                 result += f" ({', '.join(teacher_names)})"
             result += "\n"
         
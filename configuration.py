@@ -10,23 +10,32 @@ class Configuration:
     teachers_per_room: int = 2
     surplus_teachers_per_room: float = 0.5
     
-    def set_grade_hours(self, grade: str, hours: int):
-        """Set the number of hours for a specific grade"""
+    def set_grade_hours(self, grade: str, hours: int) -> bool:
+        """Set the number of hours for a specific grade. Returns True if the configuration changed"""
         if hours < 0:
             raise ValueError("Hours cannot be negative")
+        if grade in self.grade_hours and self.grade_hours[grade] == hours:
+            return False
         self.grade_hours[grade] = hours
+        return True
     
-    def set_teachers_per_room(self, teachers_per_room: int):
-        """Set the number of teachers required per room"""
+    def set_teachers_per_room(self, teachers_per_room: int) -> bool:
+        """Set the number of teachers required per room. Returns True if the configuration changed"""
         if teachers_per_room < 1:
             raise ValueError("Teachers per room must be at least 1")
+        if self.teachers_per_room == teachers_per_room:
+            return False
         self.teachers_per_room = teachers_per_room
+        return True
     
-    def set_surplus_teachers_per_room(self, surplus_teachers_per_room: float):
-        """Set the number of surplus teachers per room"""
+    def set_surplus_teachers_per_room(self, surplus_teachers_per_room: float) -> bool:
+        """Set the number of surplus teachers per room. Returns True if the configuration changed"""
         if surplus_teachers_per_room < 0:
             raise ValueError("Surplus teachers per room cannot be negative")
+        if self.surplus_teachers_per_room == surplus_teachers_per_room:
+            return False
         self.surplus_teachers_per_room = surplus_teachers_per_room
+        return True
     
     def get_grade_hours(self, grade: str) -> int:
         """Get the number of hours for a specific grade"""
@@ -105,12 +114,13 @@ class Configuration:
             Dictionary with (day_number, seance_number) as key and required teachers as value
         """
         requirements = {}
+        teachers_per_room = self.teachers_per_room
         
         for day_idx, date in enumerate(seances.dates, 1):  # Start from day 1
             date_seances = seances.get_seances_by_date(date)
             for seance_idx, seance in enumerate(date_seances, 1):  # Start from seance 1
                 num_rooms = len(seance.salles)
-                required_teachers = num_rooms * self.teachers_per_room
+                required_teachers = num_rooms * teachers_per_room
                 requirements[(day_idx, seance_idx)] = required_teachers
         
         return requirements
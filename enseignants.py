@@ -1,52 +1,13 @@
 from dataclasses import dataclass, field
-from typing import List, Set, Optional, Dict, Tuple
-import csv
-import os
-from datetime import datetime
-
-
-def read_data_file(file_path: str):
-    """Read data from CSV or XLSX file and return rows as dictionaries"""
-    file_ext = os.path.splitext(file_path)[1].lower()
-    
-    if file_ext == '.xlsx':
-        try:
-            import openpyxl
-        except ImportError:
-            raise ImportError("openpyxl library is required for Excel files. Install it with: pip install openpyxl")
-        
-        workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook.active
-        
-        # Get header row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Read data rows
-        rows = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if any(cell is not None for cell in row):  # Skip empty rows
-                row_dict = {headers[i]: str(row[i]) if row[i] is not None else '' for i in range(len(headers))}
-                rows.append(row_dict)
-        
-        workbook.close()
-        return rows
-        
-    elif file_ext == '.csv':
-        rows = []
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                rows.append(row)
-        return rows
-    
-    else:
-        raise ValueError(f"Unsupported file format: {file_ext}. Only .csv and .xlsx are supported.")
+from typing import Iterable, List, Set, Optional, Dict, Tuple
+from collections import Counter
+from seances import parse_date, read_data_file
 
 
 def get_weekday_from_date(date_str: str) -> int:
     """Convert date string (DD/MM/YYYY) to weekday number (0=Monday, 6=Sunday)"""
     try:
-        date_obj = datetime.strptime(date_str, '%d/%m/%Y')
+        date_obj = parse_date(date_str)
         return date_obj.weekday()
     except ValueError:
         return -1
@@ -77,10 +38,18 @@ class Souhaits:
         """Add a day and session combination that the teacher wants to avoid"""
         self.unavailable_slots.add((day, seance))
     
+    def set_unavailable_slots(self, slots: Iterable[Tuple[int, int]]):
+        """Replace all the day and session combinations that the teacher wants to avoid"""
+        self.unavailable_slots = set(slots)
+    
     def is_available(self, day: int, seance: int) -> bool:
         """Check if the teacher is available for a specific day and session"""
         return (day, seance) not in self.unavailable_slots
     
+    def get_unavailable_slots_among(self, slots: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """Get the (day_number, session_number) combinations among slots that the teacher wants to avoid"""
+        return self.unavailable_slots.intersection(slots)
+    
     def get_unavailable_days(self) -> Set[int]:
         """Get all days the teacher is unavailable"""
         return {day for day, _ in self.unavailable_slots}
@@ -100,12 +69,34 @@ class Enseignant:
     code: Optional[int] = None
     participe_surveillance: bool = False
     souhaits: Optional[Souhaits] = None
+    conflicts: List[dict] = field(default_factory=list, repr=False, compare=False)
     
     def __post_init__(self):
         """Convert string boolean to actual boolean for participe_surveillance"""
         if isinstance(self.participe_surveillance, str):
             self.participe_surveillance = self.participe_surveillance.upper() == 'TRUE'
     
+    def __getstate__(self):
+        """Pickle the fields only, leaving out the cached full name"""
+        state = self.__dict__.copy()
+        state.pop('_full_name', None)
+        return state
+    
+    def __setstate__(self, state):
+        """Restore from pickle, adding the conflicts list that older saves don't contain"""
+        self.__dict__.update(state)
+        if 'conflicts' not in state:
+            self.conflicts = []
+    
+    @property
+    def full_name(self) -> str:
+        """The teacher's name as "prenom nom", built once and rebuilt only after prenom or nom is reassigned"""
+        cached = self.__dict__.get('_full_name')
+        if cached is None or cached[0] is not self.prenom or cached[1] is not self.nom:
+            cached = (self.prenom, self.nom, f"{self.prenom} {self.nom}")
+            self.__dict__['_full_name'] = cached
+        return cached[2]
+    
     def add_souhaits(self, souhaits: Souhaits):
         """Add preferences for this teacher"""
         self.souhaits = souhaits
@@ -115,6 +106,12 @@ class Enseignant:
         if self.souhaits is None:
             return True  # No preferences means available for all slots
         return self.souhaits.is_available(day, seance)
+    
+    def get_unavailable_slots_among(self, slots: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """Get the (day, seance) slots among slots the teacher is unavailable for"""
+        if self.souhaits is None:
+            return set()  # No preferences means available for all slots
+        return self.souhaits.get_unavailable_slots_among(slots)
 
 
 @dataclass
@@ -122,6 +119,37 @@ class Enseignants:
     """Main structure containing all teachers"""
     enseignants_list: List[Enseignant] = field(default_factory=list)
     unique_grades: Set[str] = field(default_factory=set)
+    # Lookup indexes over enseignants_list, kept in sync by the add/remove/update methods
+    _by_email: Dict[str, Enseignant] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_code: Dict[int, Enseignant] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Number of teachers per grade; unique_grades holds the grades with a non-zero count
+    _grade_counts: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Build lookup indexes for teachers passed to the constructor"""
+        self.rebuild_indexes()
+    
+    def __setstate__(self, state):
+        """Restore from pickle, rebuilding indexes that older saves don't contain"""
+        self.__dict__.update(state)
+        self.rebuild_indexes()
+    
+    def rebuild_indexes(self):
+        """Rebuild the email and code lookup indexes and the grade counts from enseignants_list"""
+        # Iterate in reverse so the first teacher wins on duplicates, like a linear scan would
+        self._by_email = {ens.email: ens for ens in reversed(self.enseignants_list)}
+        self._by_code = {ens.code: ens for ens in reversed(self.enseignants_list) if ens.code is not None}
+        self._grade_counts = Counter(ens.grade for ens in self.enseignants_list)
+        self.unique_grades = set(self._grade_counts)
+    
+    def _count_grade(self, grade: str, delta: int):
+        """Adjust the number of teachers with a grade, keeping unique_grades in sync"""
+        self._grade_counts[grade] += delta
+        if self._grade_counts[grade] > 0:
+            self.unique_grades.add(grade)
+        else:
+            del self._grade_counts[grade]
+            self.unique_grades.discard(grade)
     
     def get_used_codes(self) -> Set[int]:
         """Get all codes that are currently in use"""
@@ -157,21 +185,45 @@ class Enseignants:
                 print(f"Warning: Code {old_code} already in use for {enseignant.prenom} {enseignant.nom}. Assigned new code: {enseignant.code}")
         
         self.enseignants_list.append(enseignant)
-        self.unique_grades.add(enseignant.grade)
+        self._count_grade(enseignant.grade, 1)
+        self._by_email[enseignant.email] = enseignant
+        self._by_code[enseignant.code] = enseignant
+    
+    def _unindex(self, enseignant: Enseignant):
+        """Drop a teacher's entries from the lookup indexes"""
+        if self._by_email.get(enseignant.email) is enseignant:
+            del self._by_email[enseignant.email]
+        if self._by_code.get(enseignant.code) is enseignant:
+            del self._by_code[enseignant.code]
+    
+    def remove_enseignant(self, enseignant: Enseignant):
+        """Remove a teacher from the list and the lookup indexes"""
+        self.enseignants_list.remove(enseignant)
+        self._unindex(enseignant)
+        self._count_grade(enseignant.grade, -1)
+    
+    def update_identity(self, enseignant: Enseignant, email: str, code: Optional[int]):
+        """Change a teacher's email and code, keeping the lookup indexes in sync"""
+        self._unindex(enseignant)
+        enseignant.email = email
+        enseignant.code = code
+        self._by_email[email] = enseignant
+        if code is not None:
+            self._by_code[code] = enseignant
+    
+    def set_grade(self, enseignant: Enseignant, grade: str):
+        """Change a teacher's grade, keeping unique_grades in sync"""
+        self._count_grade(enseignant.grade, -1)
+        enseignant.grade = grade
+        self._count_grade(grade, 1)
     
     def get_enseignant_by_email(self, email: str) -> Optional[Enseignant]:
         """Get a teacher by their email address"""
-        for enseignant in self.enseignants_list:
-            if enseignant.email == email:
-                return enseignant
-        return None
+        return self._by_email.get(email)
     
     def get_enseignant_by_code(self, code: int) -> Optional[Enseignant]:
         """Get a teacher by their code"""
-        for enseignant in self.enseignants_list:
-            if enseignant.code == code:
-                return enseignant
-        return None
+        return self._by_code.get(code)
     
     def get_enseignant_by_name(self, nom: str, prenom: str) -> Optional[Enseignant]:
         """Get a teacher by their full name"""
@@ -200,19 +252,29 @@ class Enseignants:
         enseignant.add_souhaits(souhaits)
         return True
     
-    def clear_all_souhaits(self):
-        """Clear all souhaits for all teachers"""
+    def clear_all_souhaits(self) -> int:
+        """Clear all souhaits for all teachers. Returns the number of teachers that had souhaits"""
+        cleared = 0
         for enseignant in self.enseignants_list:
-            enseignant.souhaits = None
+            if enseignant.souhaits is not None:
+                enseignant.souhaits = None
+                cleared += 1
+        return cleared
     
-    def load_souhaits_from_csv(self, csv_file_path: str, seances_data, clear_existing: bool = True) -> Dict[str, List[str]]:
+    def load_souhaits_from_csv(self, csv_file_path, seances_data, clear_existing: bool = True, file_ext: Optional[str] = None) -> Dict[str, List[str]]:
         """Load teacher preferences from CSV or XLSX file. Returns dict of errors by teacher name
         
         Args:
-            csv_file_path: Path to the CSV or XLSX file
+            csv_file_path: Path to the CSV or XLSX file, or an open file-like object
             seances_data: Seances object to map weekdays to actual exam dates
             clear_existing: If True, clear all existing souhaits before loading new ones
+            file_ext: Extension of csv_file_path when it is a file-like object
         """
+        # Read data from CSV or XLSX file
+        return self.load_souhaits_from_rows(read_data_file(csv_file_path, file_ext), seances_data, clear_existing)
+    
+    def load_souhaits_from_rows(self, rows: Iterable[dict], seances_data, clear_existing: bool = True) -> Dict[str, List[str]]:
+        """Load teacher preferences from rows already read from a CSV or XLSX file. Returns dict of errors by teacher name"""
         errors = {}
         
         # Clear existing souhaits if requested
@@ -236,9 +298,6 @@ class Enseignants:
         # Group souhaits by teacher
         teacher_souhaits = {}
         
-        # Read data from CSV or XLSX file
-        rows = read_data_file(csv_file_path)
-        
         for row in rows:
             enseignant_name = row['Enseignant'].strip()
             semestre = row['Semestre'].strip()
@@ -344,12 +403,15 @@ class Enseignants:
         return errors
     
     @classmethod
-    def from_csv(cls, csv_file_path: str) -> 'Enseignants':
+    def from_csv(cls, csv_file_path, file_ext: Optional[str] = None) -> 'Enseignants':
         """Create an Enseignants object from CSV or XLSX file"""
-        enseignants_obj = cls()
-        
         # Read data from CSV or XLSX file
-        rows = read_data_file(csv_file_path)
+        return cls.from_rows(read_data_file(csv_file_path, file_ext))
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> 'Enseignants':
+        """Create an Enseignants object from rows already read from a CSV or XLSX file"""
+        enseignants_obj = cls()
         
         for row in rows:
             nom = row['nom_ens'].strip()
@@ -6,6 +6,7 @@ Utilise WeasyPrint pour générer des documents français formatés
 import os
 from pathlib import Path
 from typing import List
+from functools import lru_cache
 from weasyprint import HTML, CSS
 from datetime import datetime
 
@@ -30,6 +31,15 @@ def normalize_time_format(time_str: str) -> str:
     return "00:00:00"
 
 
+@lru_cache(maxsize=None)
+def _parse_css(css_content: str) -> CSS:
+    """
+    Analyse une feuille de style une seule fois par processus
+    (chaque générateur produit toujours la même)
+    """
+    return CSS(string=css_content)
+
+
 class EnseignantEmploiGenerator:
     """
     Générateur d'emploi du temps pour les enseignants surveillants
@@ -53,7 +63,7 @@ class EnseignantEmploiGenerator:
         self,
         enseignant_name: str,
         schedule: List[tuple],
-        output_path: str
+        output_path: str = None
     ) -> dict:
         """
         Génère un document PDF d'emploi du temps pour un enseignant
@@ -61,15 +71,16 @@ class EnseignantEmploiGenerator:
         Args:
             enseignant_name: Nom de l'enseignant
             schedule: Liste de tuples (date, h_debut, h_fin)
-            output_path: Chemin de sortie du fichier PDF
+            output_path: Chemin de sortie du fichier PDF (None pour renvoyer son contenu dans 'pdf_bytes')
             
         Returns:
             dict: Rapport de génération avec statut et informations
         """
         try:
             # Créer le répertoire de sortie si nécessaire
-            output_dir = Path(output_path).parent
-            output_dir.mkdir(parents=True, exist_ok=True)
+            if output_path is not None:
+                output_dir = Path(output_path).parent
+                output_dir.mkdir(parents=True, exist_ok=True)
             
             # Générer le HTML
             html_content = self._generate_html_content(enseignant_name, schedule)
@@ -79,18 +90,22 @@ class EnseignantEmploiGenerator:
             
             # Créer le PDF avec WeasyPrint
             html_doc = HTML(string=html_content, base_url=str(Path(__file__).parent.parent))
-            css_doc = CSS(string=css_content)
+            css_doc = _parse_css(css_content)
             
-            html_doc.write_pdf(output_path, stylesheets=[css_doc])
+            # Sans chemin de sortie, WeasyPrint renvoie le contenu du PDF
+            pdf_bytes = html_doc.write_pdf(output_path, stylesheets=[css_doc])
             
-            return {
+            result = {
                 'status': 'success',
-                'message': f'PDF généré avec succès: {output_path}',
+                'message': f'PDF généré avec succès: {output_path or "en mémoire"}',
                 'output_path': output_path,
                 'enseignant': enseignant_name,
                 'schedule_count': len(schedule),
                 'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
+            if output_path is None:
+                result['pdf_bytes'] = pdf_bytes
+            return result
             
         except Exception as e:
             return {
@@ -402,7 +417,7 @@ class SurveillanceReportGenerator:
         session: str,
         date: str,
         seance_name: str,
-        output_path: str
+        output_path: str = None
     ) -> dict:
         """
         Génère un document PDF de liste d'affectation des surveillants
@@ -414,15 +429,16 @@ class SurveillanceReportGenerator:
             session: Type de session ("principal" ou "controle")
             date: Date de l'examen
             seance_name: Nom de la séance ("S1" ou "S2")
-            output_path: Chemin de sortie du fichier PDF
+            output_path: Chemin de sortie du fichier PDF (None pour renvoyer son contenu dans 'pdf_bytes')
             
         Returns:
             dict: Rapport de génération avec statut et informations
         """
         try:
             # Créer le répertoire de sortie si nécessaire
-            output_dir = Path(output_path).parent
-            output_dir.mkdir(parents=True, exist_ok=True)
+            if output_path is not None:
+                output_dir = Path(output_path).parent
+                output_dir.mkdir(parents=True, exist_ok=True)
             
             # Générer le HTML
             html_content = self._generate_html_content(
@@ -434,17 +450,21 @@ class SurveillanceReportGenerator:
             
             # Créer le PDF avec WeasyPrint
             html_doc = HTML(string=html_content, base_url=str(Path(__file__).parent.parent))
-            css_doc = CSS(string=css_content)
+            css_doc = _parse_css(css_content)
             
-            html_doc.write_pdf(output_path, stylesheets=[css_doc])
+            # Sans chemin de sortie, WeasyPrint renvoie le contenu du PDF
+            pdf_bytes = html_doc.write_pdf(output_path, stylesheets=[css_doc])
             
-            return {
+            result = {
                 'status': 'success',
-                'message': f'PDF généré avec succès: {output_path}',
+                'message': f'PDF généré avec succès: {output_path or "en mémoire"}',
                 'output_path': output_path,
                 'enseignants_count': len(enseignants),
                 'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
+            if output_path is None:
+                result['pdf_bytes'] = pdf_bytes
+            return result
             
         except Exception as e:
             return {
@@ -715,7 +735,7 @@ def create_surveillance_report(
     session: str,
     date: str,
     seance_name: str,
-    output_path: str,
+    output_path: str = None,
     logo_path: str = None
 ) -> dict:
     """
@@ -728,7 +748,7 @@ def create_surveillance_report(
         session: Type de session ("principal" ou "controle")
         date: Date de l'examen
         seance_name: Nom de la séance ("S1" ou "S2")
-        output_path: Chemin de sortie du fichier PDF
+        output_path: Chemin de sortie du fichier PDF (None pour renvoyer son contenu dans 'pdf_bytes')
         logo_path: Chemin vers le logo (optionnel)
         
     Returns:
@@ -743,7 +763,7 @@ def create_surveillance_report(
 def create_enseignant_emploi(
     enseignant_name: str,
     schedule: List[tuple],
-    output_path: str,
+    output_path: str = None,
     logo_path: str = None
 ) -> dict:
     """
@@ -752,7 +772,7 @@ def create_enseignant_emploi(
     Args:
         enseignant_name: Nom de l'enseignant
         schedule: Liste de tuples (date, h_debut, h_fin)
-        output_path: Chemin de sortie du fichier PDF
+        output_path: Chemin de sortie du fichier PDF (None pour renvoyer son contenu dans 'pdf_bytes')
         logo_path: Chemin vers le logo (optionnel)
         
     Returns:
@@ -760,3 +780,12 @@ def create_enseignant_emploi(
     """
     generator = EnseignantEmploiGenerator(logo_path)
     return generator.generate_emploi(enseignant_name, schedule, output_path)
+
+
+def prewarm() -> None:
+    """
+    Prépare les feuilles de style des deux documents, pour que le premier
+    PDF généré ne paie pas leur analyse
+    """
+    _parse_css(EnseignantEmploiGenerator()._generate_css_styles())
+    _parse_css(SurveillanceReportGenerator()._generate_css_styles())
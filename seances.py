@@ -1,39 +1,111 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
-from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+from datetime import date as date_type, datetime, time
+import bisect
 import csv
 import os
 
 
-def read_data_file(file_path: str):
-    """Read data from CSV or XLSX file and return rows as dictionaries"""
-    file_ext = os.path.splitext(file_path)[1].lower()
+def parse_date(date_str: str, date_format: str = '%d/%m/%Y') -> datetime:
+    """Parse a date like datetime.strptime, slicing DD/MM/YYYY and YYYY-MM-DD strings directly instead of going through strptime"""
+    if len(date_str) == 10:
+        if date_format == '%d/%m/%Y' and date_str[2] == '/' and date_str[5] == '/':
+            day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+        elif date_format == '%Y-%m-%d' and date_str[4] == '-' and date_str[7] == '-':
+            year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+        else:
+            return datetime.strptime(date_str, date_format)
+        
+        # Anything unusual (signs, spaces, non-ASCII digits) goes through strptime for identical errors
+        if (year + month + day).isascii() and (year + month + day).isdigit():
+            return datetime(int(year), int(month), int(day))
+    
+    return datetime.strptime(date_str, date_format)
+
+
+# Names of the first sessions of a day, shared instead of formatting a new string for every row
+SEANCE_NAMES = tuple(f"S{number}" for number in range(1, 65))
+
+
+def seance_name(seance_number: int) -> str:
+    """Get the display name (S1, S2, etc.) for a 1-based seance number"""
+    if 1 <= seance_number <= len(SEANCE_NAMES):
+        return SEANCE_NAMES[seance_number - 1]
+    return f"S{seance_number}"
+
+
+def _from_calamine(value):
+    """Convert a python-calamine cell value to what openpyxl would return for the same cell"""
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date_type) and not isinstance(value, datetime):
+        return datetime.combine(value, time())
+    return value
+
+
+def iter_xlsx_rows(source):
+    """Yield the rows of the first sheet of an XLSX path or binary file-like object, with None for empty cells"""
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+    
+    # python-calamine (Rust) parses large workbooks much faster than openpyxl; openpyxl remains the fallback
+    if CalamineWorkbook is not None:
+        if isinstance(source, str):
+            workbook = CalamineWorkbook.from_path(source)
+        else:
+            workbook = CalamineWorkbook.from_filelike(source)
+        for row in workbook.get_sheet_by_index(0).to_python():
+            yield tuple(_from_calamine(value) for value in row)
+        return
+    
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("openpyxl library is required for Excel files. Install it with: pip install openpyxl")
+    
+    # Read-only mode streams rows instead of loading every cell up front
+    workbook = openpyxl.load_workbook(source, read_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def xlsx_rows_to_dicts(headers: list, sheet_rows) -> List[dict]:
+    """Convert XLSX data rows to dictionaries keyed by the header row, skipping empty rows"""
+    rows = []
+    for row in sheet_rows:
+        if any(cell is not None for cell in row):  # Skip empty rows
+            # Rows can be shorter than the header when trailing cells are empty
+            row_dict = {headers[i]: str(row[i]) if i < len(row) and row[i] is not None else '' for i in range(len(headers))}
+            rows.append(row_dict)
+    return rows
+
+
+def read_data_file(source, file_ext: Optional[str] = None):
+    """Read data from a CSV or XLSX path, or a file-like object given with its file_ext, and return rows as dictionaries"""
+    if file_ext is None:
+        file_ext = os.path.splitext(source)[1]
+    file_ext = file_ext.lower()
     
     if file_ext == '.xlsx':
-        try:
-            import openpyxl
-        except ImportError:
-            raise ImportError("openpyxl library is required for Excel files. Install it with: pip install openpyxl")
-        
-        workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook.active
+        sheet_rows = iter_xlsx_rows(source)
         
         # Get header row
-        headers = [cell.value for cell in sheet[1]]
-        
-        # Read data rows
-        rows = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if any(cell is not None for cell in row):  # Skip empty rows
-                row_dict = {headers[i]: str(row[i]) if row[i] is not None else '' for i in range(len(headers))}
-                rows.append(row_dict)
+        headers = list(next(sheet_rows, ()))
         
-        workbook.close()
-        return rows
+        return xlsx_rows_to_dicts(headers, sheet_rows)
         
     elif file_ext == '.csv':
+        if not isinstance(source, str):
+            return list(csv.DictReader(source))
+        
         rows = []
-        with open(file_path, 'r', encoding='utf-8') as file:
+        with open(source, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
             for row in reader:
                 rows.append(row)
@@ -58,6 +130,14 @@ class Seance:
     def add_enseignant(self, enseignant: int):
         """Add a teacher to this session"""
         self.responsables.add(enseignant)
+    
+    def add_salles(self, salles: Iterable[str]):
+        """Add several rooms to this session"""
+        self.salles.update(salles)
+    
+    def add_enseignants(self, enseignants: Iterable[int]):
+        """Add several teachers to this session"""
+        self.responsables.update(enseignants)
 
 
 @dataclass
@@ -68,6 +148,36 @@ class Seances:
     date_seances: Dict[str, List[Seance]] = field(default_factory=dict)  # date -> ordered list of seances
     exam_type: Optional[str] = None  # "Examen" or "Devoir surveillé"
     session: Optional[str] = None  # "Principal" or "Contrôle"
+    _total_sessions: int = field(default=0, init=False, repr=False, compare=False)  # Kept in sync by add/remove methods
+    _date_keys: Dict[str, datetime] = field(default_factory=dict, init=False, repr=False, compare=False)  # date -> parsed datetime
+    
+    def __post_init__(self):
+        """Count sessions passed to the constructor"""
+        self._total_sessions = sum(len(sessions) for sessions in self.date_seances.values())
+    
+    def __setstate__(self, state):
+        """Restore from pickle, recounting sessions for saves made before the counter existed"""
+        self.__dict__.update(state)
+        self._total_sessions = sum(len(sessions) for sessions in self.date_seances.values())
+        self._date_keys = {}
+    
+    def get_date_key(self, date: str) -> datetime:
+        """Get the parsed datetime for a DD/MM/YYYY date, parsing each date string only once"""
+        key = self._date_keys.get(date)
+        if key is None:
+            key = self._date_keys[date] = parse_date(date)
+        return key
+    
+    def add_date(self, date: str) -> bool:
+        """Add an exam date with no sessions and keep dates in chronological order. Returns False if it already exists"""
+        if date in self.dates:
+            return False
+        
+        self.get_date_key(date)  # Fails before anything is modified if the date is invalid
+        self.dates.append(date)
+        self.dates.sort(key=self.get_date_key)
+        self.date_seances[date] = []
+        return True
     
     def add_seance(self, date: str, seance: Seance):
         """Add a session to a specific date"""
@@ -76,6 +186,59 @@ class Seances:
             if date not in self.dates:
                 self.dates.append(date)
         self.date_seances[date].append(seance)
+        self._total_sessions += 1
+    
+    def insert_seance(self, date: str, seance: Seance) -> int:
+        """Add a session to a specific date, keeping that date's sessions ordered by start time. Returns its index"""
+        if date not in self.date_seances:
+            self.add_seance(date, seance)
+            return 0
+        
+        seances = self.date_seances[date]
+        index = bisect.bisect_right([s.h_debut for s in seances], seance.h_debut)
+        seances.insert(index, seance)
+        self._total_sessions += 1
+        return index
+    
+    def reposition_seance(self, date: str, index: int) -> int:
+        """Move a session back into start-time order after its h_debut changed, placing it where a stable sort would. Returns its new index"""
+        seances = self.date_seances[date]
+        seance = seances.pop(index)
+        start_times = [s.h_debut for s in seances]
+        # Sessions with the same start time keep their relative order, so the session stays
+        # at its old index unless that is now outside the run of equal start times
+        new_index = min(max(index, bisect.bisect_left(start_times, seance.h_debut)),
+                        bisect.bisect_right(start_times, seance.h_debut))
+        seances.insert(new_index, seance)
+        return new_index
+    
+    def remove_seance(self, date: str, index: int):
+        """Remove a session by date and index (0-based), dropping the date once it has no sessions left"""
+        del self.date_seances[date][index]
+        self._total_sessions -= 1
+        
+        if not self.date_seances[date]:
+            del self.date_seances[date]
+            if date in self.dates:
+                self.dates.remove(date)
+    
+    def remove_date(self, date: str) -> bool:
+        """Remove a date and all its sessions. Returns True if the date was present"""
+        removed = False
+        if date in self.dates:
+            self.dates.remove(date)
+            removed = True
+        
+        if date in self.date_seances:
+            self._total_sessions -= len(self.date_seances.pop(date))
+            removed = True
+        
+        self._date_keys.pop(date, None)
+        return removed
+    
+    def get_total_sessions(self) -> int:
+        """Get the number of sessions across all dates"""
+        return self._total_sessions
     
     def get_seances_by_date(self, date: str) -> List[Seance]:
         """Get all sessions for a specific date"""
@@ -90,19 +253,22 @@ class Seances:
     
     def get_seance_name(self, date: str, index: int) -> str:
         """Get the name (S1, S2, etc.) for a seance based on its position"""
-        return f"S{index + 1}"
+        return seance_name(index + 1)
     
     @classmethod
-    def from_csv(cls, csv_file_path: str) -> 'Seances':
-        """Create a Seances object from CSV or XLSX file"""
+    def from_csv(cls, csv_file_path, file_ext: Optional[str] = None) -> 'Seances':
+        """Create a Seances object from a CSV or XLSX file path or file-like object (see read_data_file)"""
+        # Read data from CSV or XLSX file
+        return cls.from_rows(read_data_file(csv_file_path, file_ext))
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> 'Seances':
+        """Create a Seances object from rows already read from a CSV or XLSX file"""
         seances_obj = cls()
         
         # Track sessions by date and time
         date_time_sessions = {}  # (date, h_debut, h_fin) -> seance
         
-        # Read data from CSV or XLSX file
-        rows = read_data_file(csv_file_path)
-        
         for row in rows:
             date_exam = row['dateExam']
             # Extract only time part from h_debut and h_fin (format: "30/12/1999 HH:MM:SS")
@@ -205,10 +371,9 @@ class Seances:
     
     def __str__(self) -> str:
         """String representation"""
-        total_sessions = sum(len(sessions) for sessions in self.date_seances.values())
         result = f"Seances - {self.semester} ({self.exam_type}, {self.session})\n"
         result += f"Dates: {', '.join(self.dates)}\n"
-        result += f"Total sessions: {total_sessions}\n\n"
+        result += f"Total sessions: {self.get_total_sessions()}\n\n"
         
         for date in self.dates:
             result += f"Date: {date}\n"
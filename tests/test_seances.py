@@ -0,0 +1,33 @@
+from seances import Seance, Seances
+
+
+def make_seances(*start_times):
+    seances = Seances()
+    for h_debut in start_times:
+        seances.add_seance('01/06/2025', Seance(h_debut, '12:00:00'))
+    return seances
+
+
+def test_reposition_seance_keeps_index_among_equal_start_times():
+    seances = make_seances('08:30:00', '08:30:00')
+    first = seances.date_seances['01/06/2025'][0]
+    
+    assert seances.reposition_seance('01/06/2025', 0) == 0
+    assert seances.date_seances['01/06/2025'][0] is first
+
+
+def test_reposition_seance_matches_stable_sort():
+    for start_times in [('08:00:00', '09:00:00', '10:00:00'), ('08:30:00', '08:30:00', '08:30:00'),
+                        ('08:00:00', '10:00:00', '10:00:00', '14:00:00')]:
+        for index in range(len(start_times)):
+            for h_debut in ['07:00:00', '08:00:00', '08:30:00', '10:00:00', '12:00:00', '14:00:00', '16:00:00']:
+                seances = make_seances(*start_times)
+                day_seances = seances.date_seances['01/06/2025']
+                day_seances[index].h_debut = h_debut
+                expected = sorted(day_seances, key=lambda s: s.h_debut)
+                moved = day_seances[index]
+                
+                new_index = seances.reposition_seance('01/06/2025', index)
+                
+                assert [id(s) for s in day_seances] == [id(s) for s in expected]
+                assert day_seances[new_index] is moved